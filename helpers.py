@@ -1,18 +1,47 @@
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as csv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import seaborn as sns
 
 sns.set_style("whitegrid")
 
+# Arrow-backed string dtype, so that .str methods run on Arrow's compute kernels
+ARROW_STRING = pd.ArrowDtype(pa.string())
+ARROW_FLOAT = pd.ArrowDtype(pa.float64())
+ARROW_FLOAT32 = pd.ArrowDtype(pa.float32())
+
+# Bytes of CSV parsed per block by each thread of the CSV reader. Type inference
+# only looks at the first block, so it should hold plenty of rows.
+CSV_BLOCK_SIZE = 16 << 20
+
+# Directory of the raw CSVs converted to Parquet, and their compression codec
+RAW_PARQUET_DIR = "data/raw_parquet"
+PARQUET_COMPRESSION = "snappy"
+
+# Compression codec and number of rows per record batch of written feather files
+FEATHER_COMPRESSION = "lz4"
+FEATHER_CHUNKSIZE = 1 << 16
+
 
 # ==================================================
 # DATA EXPLORATION
 # This section contains functions for data exploration.
 # ==================================================
 
+# Set to False to turn the plot functions into no-ops, e.g. when they are
+# called in bulk from a script
+PLOTS_ENABLED = True
+
 
 def get_cat_distribution(s, report_pct=True):
     """
@@ -47,6 +76,9 @@ def plot_cat_distribution(s, top_n=10, report_pct=True, sort_index=False):
     Authors:
         Tue Nguyen
     """
+    if not PLOTS_ENABLED:
+        return
+
     # Get distribution
     dist = get_cat_distribution(s, report_pct).sort_values()
 
@@ -86,6 +118,9 @@ def plot_num_distribution(s, showfliers=False):
     Authors:
         Tue Nguyen
     """
+    if not PLOTS_ENABLED:
+        return
+
     # Config
     if showfliers:
         plt_title = "Box plot"
@@ -105,14 +140,23 @@ def plot_num_distribution(s, showfliers=False):
 # ==================================================
 
 
-def read_raw_data(filename, col_mapping, low_memory=True):
+def read_raw_data(filename, col_mapping, use_staged=True, dtype=None, parse_dates=None):
     """
     Reads a raw data file (CSV), subset columns, and rename columns.
 
+    The CSV is parsed by Arrow's multi-threaded reader and columns stay
+    Arrow-backed, so that string columns don't hold a Python object per cell.
+    By default the CSV is staged as Parquet once (see stage_parquet) and only
+    the mapped columns are read from the Parquet file afterwards.
+
     Args:
         filename (str): path to CSV file.
         col_mapping (dict): a dict contains old_col_name:new_col_name pairs
-        low_memory (bool): infer col type based on sample data if True
+        use_staged (bool): read from the staged Parquet file if True, else
+            parse the CSV
+        dtype (dict): a dict of old_col_name:ArrowDtype pairs overriding the
+            inferred dtypes, e.g. {"Id": ARROW_STRING}
+        parse_dates (list): old column names to parse as datetimes
 
     Returns:
         A data frame.
@@ -120,15 +164,117 @@ def read_raw_data(filename, col_mapping, low_memory=True):
     Authors:
         Tue Nguyen
     """
-    cols = col_mapping.keys()
-    df = pd.read_csv(filename, low_memory=low_memory, usecols=cols)[cols]
-    df = df.replace([None], np.nan).rename(columns=col_mapping)
+    cols = list(col_mapping.keys())
+    dtype = dtype or {}
+    column_types = {c: t.pyarrow_dtype for c, t in dtype.items()}
+
+    if use_staged:
+        staged = stage_parquet(filename, column_types=column_types)
+        table = pq.read_table(staged, columns=cols)
+    else:
+        table = read_csv_table(filename, columns=cols, column_types=column_types)
+    df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+    # The staged file may predate the current dtype hints
+    df = df.astype(dtype)
+
+    # Timestamps in ISO format are already parsed by the CSV reader, but
+    # date-only values are read as dates, which must still become datetimes
+    for c in parse_dates or []:
+        if not pa.types.is_timestamp(df[c].dtype.pyarrow_dtype):
+            df[c] = pd.to_datetime(df[c])
+
+    df = df.rename(columns=col_mapping)
     return df
 
 
+def read_csv_table(filename, columns=None, column_types=None):
+    """
+    Reads a CSV file into an Arrow table. Empty cells are read as nulls.
+
+    Args:
+        filename (str): path to CSV file.
+        columns (list): columns to read, all columns if None.
+        column_types (dict): a dict of col_name:pyarrow.DataType pairs
+            overriding the inferred types.
+
+    Returns:
+        A pyarrow.Table.
+    """
+    return csv.read_csv(
+        filename,
+        read_options=csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=csv.ConvertOptions(
+            include_columns=columns,
+            column_types=column_types,
+            strings_can_be_null=True,
+        ),
+    )
+
+
+def stage_parquet(filename, column_types=None):
+    """
+    Converts a CSV file to a Parquet file in RAW_PARQUET_DIR, unless it is
+    already staged and newer than the CSV. Parquet is columnar and
+    compressed, so reading a few columns of it is much faster than parsing
+    the CSV again. The CSV is streamed block by block (see CSV_BLOCK_SIZE),
+    so that the whole file is never held in memory, unless a column's type
+    only shows up after the first block.
+
+    Args:
+        filename (str): path to CSV file.
+        column_types (dict): a dict of col_name:pyarrow.DataType pairs
+            overriding the inferred types.
+
+    Returns:
+        Path to the staged Parquet file.
+    """
+    name = os.path.splitext(os.path.basename(filename))[0]
+    staged = os.path.join(RAW_PARQUET_DIR, name + ".parquet")
+
+    if not os.path.exists(staged) or os.path.getmtime(staged) < os.path.getmtime(
+        filename
+    ):
+        os.makedirs(RAW_PARQUET_DIR, exist_ok=True)
+
+        # The reader reads ahead of the writer. Memory mapping the CSV keeps
+        # the raw bytes read ahead in the page cache instead of in memory.
+        # Write to a temporary file first so that an interrupted run doesn't
+        # leave a truncated file behind.
+        try:
+            with pa.memory_map(filename) as source:
+                reader = csv.open_csv(
+                    source,
+                    read_options=csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                    convert_options=csv.ConvertOptions(
+                        column_types=column_types, strings_can_be_null=True
+                    ),
+                )
+                with pq.ParquetWriter(
+                    staged + ".tmp", reader.schema, compression=PARQUET_COMPRESSION
+                ) as writer:
+                    for batch in reader:
+                        writer.write_batch(batch)
+        except pa.ArrowInvalid:
+            # The streaming reader takes the column types from the first block
+            # only, so a sparse column whose values start later doesn't fit.
+            # Read the whole file instead, which unifies the types of all blocks.
+            table = read_csv_table(filename, column_types=column_types)
+            pq.write_table(table, staged + ".tmp", compression=PARQUET_COMPRESSION)
+            del table
+        os.replace(staged + ".tmp", staged)
+
+    return staged
+
+
 def read_feather(filename):
     """
-    Reads a feather file and and replace None with np.nan
+    Reads a feather file into Arrow-backed columns (and categories for
+    dictionary encoded columns), so that no Python object is built per
+    element and missing values are native Arrow nulls. The file is memory
+    mapped rather than read into a buffer first. Only the columns of an
+    uncompressed file share pages with it; compressed ones, such as those
+    written by write_feather, are decompressed into memory.
 
     Args:
         filename (str): path to file.
@@ -139,7 +285,40 @@ def read_feather(filename):
     Authors:
         Tue Nguyen
     """
-    return pd.read_feather(filename).replace([None], np.nan)
+    table = feather.read_table(filename, memory_map=True)
+    return table.to_pandas(types_mapper=arrow_types_mapper)
+
+
+def arrow_types_mapper(arrow_type):
+    """
+    Maps Arrow types to Arrow-backed pandas dtypes, except for dictionary
+    types, which are left to become pandas categories.
+
+    Args:
+        arrow_type (pyarrow.DataType): type of an Arrow column.
+
+    Returns:
+        A pandas dtype, or None for the default conversion.
+    """
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def write_feather(df, filename):
+    """
+    Writes a data frame to a compressed feather file.
+
+    Args:
+        df (data frame): a data frame with a default index.
+        filename (str): path to file.
+
+    Returns:
+        None.
+    """
+    df.to_feather(
+        filename, compression=FEATHER_COMPRESSION, chunksize=FEATHER_CHUNKSIZE
+    )
 
 
 def normalize_date(s):
@@ -157,29 +336,55 @@ def normalize_date(s):
     Authors:
         Tue Nguyen
     """
-    # Default return value if conversion is not possible
-    full_date = "0001-01-01"
+    return normalize_date_series(pd.Series([s], dtype=object)).iloc[0]
+
+
+# Possible date formats for parse_date_series, tried in order
+DATE_FORMATS = ["%Y-%m-%d", "%d-%m-%Y", "%m-%Y", "%Y-%m", "%Y"]
+
+# Parsed dates always have this dtype, whatever formats the data holds
+DATE_DTYPE = "datetime64[ms]"
+
+
+def parse_date_series(s):
+    """
+    Parses a series of dates written in any of DATE_FORMATS, or as ISO 8601
+    date times. Each format is only tried on the elements that the previous
+    formats could not parse, so that a column of standard dates is parsed in
+    a single vectorized pass.
+
+    Args:
+        s (series): a series of strings representing dates.
 
+    Returns:
+        A series of DATE_DTYPE datetimes, NaT where no format matches.
+    """
     # Standardize the date part separator
-    s = re.sub("[/]", "-", str(s).strip())
-
-    # Define possible date pattern
-    patterns = [
-        ("yyyy-mm-dd", "(\d{4})-((0?[1-9])|(1[0-2]))-((0?[1-9])|(1[0-2]))"),
-        ("dd-mm-yyyy", "((0?[1-9])|(1[0-2]))-((0?[1-9])|(1[0-2]))-(\d{4})"),
-        ("mm-yyyy", "((0?[1-9])|(1[0-2]))-(\d{4})"),
-        ("yyyy-mm", "(\d{4})-((0?[1-9])|(1[0-2]))"),
-        ("yyyy", "(\d{4})"),
-    ]
+    s = to_arrow_string(s).str.strip().str.replace("/", "-", regex=False)
 
-    # Date conversion
-    for d_format, d_pattern in patterns:
-        d_pattern = re.compile(d_pattern)
-        if re.match(d_pattern, s):
-            full_date = get_date_by_format(s, d_format)
+    # Only parse the elements that are not converted yet with the next format
+    parsed = pd.Series(pd.NaT, index=s.index, dtype=DATE_DTYPE)
+    for d_format in DATE_FORMATS + ["ISO8601"]:
+        todo = parsed.isna() & s.notna()
+        if not todo.any():
             break
+        values = pd.to_datetime(s[todo], format=d_format, errors="coerce", utc=True)
+        parsed[todo] = values.dt.tz_localize(None).astype(DATE_DTYPE)
+
+    return parsed
 
-    return full_date
+
+def normalize_date_series(s):
+    """
+    Vectorized version of normalize_date, based on parse_date_series.
+
+    Args:
+        s (series): a series of strings representing dates.
+
+    Returns:
+        A series of strings in the standard date format.
+    """
+    return parse_date_series(s).dt.strftime("%Y-%m-%d").fillna("0001-01-01")
 
 
 def get_date_by_format(s, d_format):
@@ -232,11 +437,54 @@ def replace_series(s, replacement_mapping):
     Authors:
         Tue Nguyen
     """
-    result = s.copy()
-    for replace_by, to_replace in replacement_mapping.items():
-        result.replace(to_replace, replace_by, regex=False, inplace=True)
+    return replace_series_by_lookup(s, invert_mapping(replacement_mapping))
 
-    return result
+
+def invert_mapping(replacement_mapping):
+    """
+    Inverts a replacement mapping into a flat lookup, so that a series can be
+    replaced with a single hash lookup per element instead of one pass per key.
+    The lookup gives the same result as applying the pairs in turn.
+
+    Args:
+        replacement_mapping (dict): a mapping of replace_by:to_replace pairs.
+
+    Returns:
+        A dict of to_replace:replace_by pairs.
+    """
+    pairs = [
+        (replace_by, {to_replace} if isinstance(to_replace, str) else set(to_replace))
+        for replace_by, to_replace in replacement_mapping.items()
+    ]
+    lookup = {}
+    for i, (replace_by, to_replace) in enumerate(pairs):
+        # The pairs are applied in turn, so a replacement can itself be
+        # replaced by a later pair
+        for later_replace_by, later_to_replace in pairs[i + 1 :]:
+            if replace_by in later_to_replace:
+                replace_by = later_replace_by
+        for x in to_replace:
+            # Keep the first pair matching an element, later pairs only see
+            # its replacement
+            lookup.setdefault(x, replace_by)
+
+    return lookup
+
+
+def replace_series_by_lookup(s, lookup):
+    """
+    Replaces elements in a series according to a flat lookup. Elements not
+    found in the lookup are kept as is.
+
+    Args:
+        s (series): a series of strings.
+        lookup (dict): a mapping of to_replace:replace_by pairs.
+
+    Returns:
+        A series after replacement.
+    """
+    result = s.map(lookup)
+    return result.where(result.notna(), s)
 
 
 def replace_if_startswith(x, pattern, replace_by):
@@ -257,9 +505,189 @@ def replace_if_startswith(x, pattern, replace_by):
     return x
 
 
+def compile_prefix_mapping(prefix_mapping):
+    """
+    Compiles a prefix mapping into a single regex matching any of the
+    prefixes, and a lookup giving the final replacement for each prefix.
+
+    The prefixes are tried in order and a replacement can in turn start with
+    a later prefix, as if replace_if_startswith was applied for each pair in
+    turn. The lookup resolves these chains once, so that each element only
+    needs one regex match.
+
+    Args:
+        prefix_mapping (dict): a mapping of prefix:replace_by pairs.
+
+    Returns:
+        A compiled regex and a dict of prefix:replace_by pairs.
+    """
+    prefixes = list(prefix_mapping)
+    lookup = {}
+    for i, prefix in enumerate(prefixes):
+        replace_by = prefix_mapping[prefix]
+        for later_prefix in prefixes[i + 1 :]:
+            replace_by = replace_if_startswith(
+                replace_by, later_prefix, prefix_mapping[later_prefix]
+            )
+        lookup[prefix] = replace_by
+
+    # Alternatives are tried left to right, so the first prefix in order wins
+    pattern = re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+
+    return pattern, lookup
+
+
+def replace_series_by_prefix(s, pattern, lookup):
+    """
+    Replaces the elements of a series starting with one of the prefixes of
+    pattern by the replacement of that prefix. The prefixes are matched by a
+    single automaton pass over each element, which takes the same first
+    matching prefix as pattern.match.
+
+    Args:
+        s (series): a series of strings.
+        pattern (re.Pattern): a regex matching any of the prefixes.
+        lookup (dict): a mapping of prefix:replace_by pairs.
+
+    Returns:
+        A series after replacement.
+    """
+    matches = pc.extract_regex(
+        pa.array(to_arrow_string(s)), pattern=f"^(?P<prefix>{pattern.pattern})"
+    )
+    prefixes = pc.struct_field(matches, [0])
+
+    to_replace = pa.array(list(lookup.keys()), type=pa.string())
+    replace_by = pa.array(list(lookup.values()), type=pa.string())
+    replaced = pc.take(replace_by, pc.index_in(prefixes, value_set=to_replace))
+    replaced = pd.Series(pd.arrays.ArrowExtensionArray(replaced), index=s.index)
+
+    return replaced.where(replaced.notna(), s)
+
+
+def to_arrow_string(s):
+    """
+    Casts a series to Arrow-backed strings. Non-string elements of an object
+    series (e.g. numbers) are treated as missing.
+
+    Args:
+        s (series): a series to cast.
+
+    Returns:
+        A series of dtype ARROW_STRING.
+    """
+    try:
+        return s.astype(ARROW_STRING)
+    except pa.ArrowTypeError:
+        return s.where(s.map(lambda x: isinstance(x, str))).astype(ARROW_STRING)
+
+
+def to_categorical(df, cols):
+    """
+    Converts columns of a data frame to category dtype in place, so that they
+    are stored as small integer codes instead of one string per row.
+
+    Args:
+        df (data frame): a data frame.
+        cols (list): names of the columns to convert.
+
+    Returns:
+        None.
+    """
+    for c in cols:
+        df[c] = df[c].astype("category")
+
+
+def to_int(df, cols, int_type):
+    """
+    Converts numeric columns of a data frame holding whole numbers to a
+    nullable Arrow integer dtype, in place. The dtype is fixed rather than
+    chosen from the data, so that the schema of the output doesn't change
+    between runs.
+
+    Args:
+        df (data frame): a data frame.
+        cols (list): names of the columns to convert.
+        int_type (pyarrow.DataType): an Arrow integer type.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: if a column holds fractional values or values out of the
+            range of int_type.
+    """
+    info = np.iinfo(int_type.to_pandas_dtype())
+    for c in cols:
+        values = pa.array(df[c])
+        whole = pc.all(pc.equal(pc.floor(values), values), min_count=0).as_py()
+        min_max = pc.min_max(values)
+        low, high = min_max["min"].as_py(), min_max["max"].as_py()
+        if (
+            not whole
+            or (low is not None and low < info.min)
+            or (high is not None and high > info.max)
+        ):
+            raise ValueError(f"Column {c} holds values that don't fit in {int_type}")
+        df[c] = df[c].astype(pd.ArrowDtype(int_type))
+
+
+def explode_normalize(col, sep, cleanup=None, lookup=None):
+    """
+    Splits each element of a series into tokens and normalizes the tokens:
+    removes the cleanup pattern, strips, converts to upper case, drops empty
+    tokens and replaces them according to lookup. All the steps run on a flat
+    Arrow array of tokens, so no Python list or object is built per element.
+
+    Args:
+        col (series): a series of strings to split.
+        sep (str or re.Pattern): regex for token separators.
+        cleanup (str or re.Pattern): regex for characters to remove from tokens.
+        lookup (dict): a mapping of to_replace:replace_by pairs. A replacement
+            standing for several tokens separates them by ";".
+
+    Returns:
+        A series of tokens, indexed by the index of the element they come from.
+    """
+    # Split and flatten the tokens, keeping the position of their element
+    splits = pc.split_pattern_regex(
+        pa.array(to_arrow_string(col)), pattern=getattr(sep, "pattern", sep)
+    )
+    positions = pc.list_parent_indices(splits)
+    tokens = pc.list_flatten(splits)
+
+    # Standardize tokens and drop empty ones
+    if cleanup:
+        tokens = pc.replace_substring_regex(
+            tokens, pattern=getattr(cleanup, "pattern", cleanup), replacement=""
+        )
+    tokens = pc.utf8_upper(pc.utf8_trim_whitespace(tokens))
+    keep = pc.not_equal(tokens, "")
+    tokens, positions = tokens.filter(keep), positions.filter(keep)
+
+    # Replace tokens found in lookup
+    if lookup:
+        to_replace = pa.array(list(lookup.keys()), type=pa.string())
+        replace_by = pa.array(list(lookup.values()), type=pa.string())
+        replaced = pc.take(replace_by, pc.index_in(tokens, value_set=to_replace))
+        tokens = pc.coalesce(replaced, tokens)
+
+        # Split replacements standing for several tokens
+        splits = pc.split_pattern(tokens, pattern=";")
+        positions = positions.take(pc.list_parent_indices(splits))
+        tokens = pc.utf8_trim_whitespace(pc.list_flatten(splits))
+
+    return pd.Series(
+        pd.arrays.ArrowExtensionArray(tokens),
+        index=col.index[positions.to_numpy()],
+        name=col.name,
+    )
+
+
 def squeeze_series(s, sep=";"):
     """
-    Squeezes a series by index and combine elements.
+    Squeezes a series by index and combine elements. Missing elements are
+    dropped and repeated elements are kept once, in order of appearance.
 
     Args:
         s (series): a series to squeeze.
@@ -271,7 +699,80 @@ def squeeze_series(s, sep=";"):
     Authors:
         Tue Nguyen
     """
-    return s.reset_index().groupby("index").agg(set).squeeze().str.join(";")
+    s = s.dropna()
+    if s.empty:
+        return pd.Series([], dtype=ARROW_STRING, name=s.name)
+
+    # Encode elements and index labels as dense integer codes (as a categorical
+    # would), in order of appearance
+    codes, uniques = pd.factorize(s)
+    groups, labels = pd.factorize(s.index)
+
+    # Deduplicate (group, element) pairs, keeping the first occurrences
+    keys = groups.astype(np.int64) * len(uniques) + codes
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    groups, codes = groups[first], codes[first]
+
+    # Sort by group so that each group is a contiguous slice
+    order = np.argsort(groups, kind="stable")
+    groups, codes = groups[order], codes[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+
+    # Append the separator once per distinct element, then concatenate the
+    # elements of each slice in a single numpy pass
+    suffixed = np.asarray(uniques, dtype=object) + sep
+    joined = np.add.reduceat(suffixed[codes], starts)
+    joined = pd.Series(
+        joined, index=labels[groups[starts]], name=s.name, dtype=ARROW_STRING
+    )
+
+    # Drop the trailing separator
+    return joined.str[: -len(sep)] if sep else joined
+
+
+def _normalize_tokens(col, sep, cleanup=None, lookup=None):
+    """
+    Normalizes a column of separated tokens: explodes and standardizes the
+    tokens with explode_normalize, then squeezes them back into one string
+    per element.
+
+    Args:
+        col (series): a series of strings to normalize.
+        sep (str or re.Pattern): regex for token separators.
+        cleanup (str or re.Pattern): regex for characters to remove from tokens.
+        lookup (dict): a mapping of to_replace:replace_by pairs.
+
+    Returns:
+        A series of ";" separated tokens.
+    """
+    tokens = explode_normalize(col, sep, cleanup=cleanup, lookup=lookup)
+    return squeeze_series(tokens)
+
+
+# Replacement mapping in the format replace_by:to_replace
+CITY_REPLACEMENT_MAPPING = {
+    "BARCELONA": ["BARCELLONA"],
+    "DUBLIN": ["DUBLINO"],
+    "EUROPE": ["EU", "EUROPEROPE"],
+    "FLORENCE": ["FIRENZE"],
+    "GENOA": ["GENOVA"],
+    "GENEVE": ["GINEVRA"],
+    "ITALY": ["ITALY MULTIPLE LOCATION"],
+    "REMOTE": ["ANCHE REMOTO", "FULL REMOTE"],
+    "LONDON": ["LONDAN", "LONDRA"],
+    "LAUSSANE": ["LOSANNA"],
+    "LUXEMBOURG": ["LUSSEMBURGO"],
+    "MILAN": ["MI", "MILANO", "MILANO ROZZANO", "MILANO OR REMOTE"],
+    "SWITZERLAND": ["CH"],
+}
+_CITY_LOOKUP = invert_mapping(CITY_REPLACEMENT_MAPPING)
+
+# Default location separators, shared by cities and countries
+_LOCATION_SEP_RE = re.compile("[-,;(/[]")
+
+# Characters to remove from cities
+_CITY_CLEAN_RE = re.compile(r"[)\]?]")
 
 
 def normalize_city_series(col, sep=None):
@@ -288,42 +789,51 @@ def normalize_city_series(col, sep=None):
     Authors:
         Tue Nguyen
     """
-    # Default value for location separators if not provided
-    if not sep:
-        sep = "[-,;(/[]"
-
-    # Replacement mapping in the format replace_by:to_replace
-    replacement_mapping = {
-        "BARCELONA": ["BARCELLONA"],
-        "DUBLIN": ["DUBLINO"],
-        "EUROPE": ["EU", "EUROPEROPE"],
-        "FLORENCE": ["FIRENZE"],
-        "GENOA": ["GENOVA"],
-        "GENEVE": ["GINEVRA"],
-        "ITALY": ["ITALY MULTIPLE LOCATION"],
-        "REMOTE": ["ANCHE REMOTO", "FULL REMOTE"],
-        "LONDON": ["LONDAN", "LONDRA"],
-        "LAUSSANE": ["LOSANNA"],
-        "LUXEMBOURG": ["LUSSEMBURGO"],
-        "MILAN": ["MI", "MILANO", "MILANO ROZZANO", "MILANO OR REMOTE"],
-        "SWITZERLAND": ["CH"],
-    }
-
-    # Explode each cell separate locations and standardize them
-    locations = (
-        col.str.split(sep)
-        .explode()
-        .str.strip()
-        .str.upper()
-        .replace("[)\]?]", "", regex=True)
-        .replace([""], np.nan, regex=False)
+    return _normalize_tokens(
+        col, sep or _LOCATION_SEP_RE, cleanup=_CITY_CLEAN_RE, lookup=_CITY_LOOKUP
     )
 
-    # Perform replacement and squeeze
-    locations = replace_series(locations, replacement_mapping)
-    locations = squeeze_series(locations)
 
-    return locations
+# Replacement mapping in the format replace_by:to_replace
+COUNTRY_REPLACEMENT_MAPPING = {
+    "IT": [
+        "ITALY",
+        "ITALIA",
+        "ITALT",
+        "ITALY",
+        "ITLAY",
+        "`ITALY",
+        "ITALIA O SVIZZERA",
+        "IRALT",
+        "MILAN",
+        "ROMA",
+        "VENETO",
+    ],
+    "AR": ["ARGENTINA"],
+    "AU": ["AUSTRALIA"],
+    "BE": ["BELGIO"],
+    "FR": ["FRANCE"],
+    "DE": ["GERMANY"],
+    "HU": ["HUNGARY"],
+    "IE": ["IRELAND"],
+    "IL": ["ISRAEL"],
+    "JP": ["JO"],
+    "GB": ["LONDON", "SCOZIA", "UK", "UNITED KINGDOM"],
+    "US": ["USA"],
+    "LU": ["LUXEMBOURG"],
+    "MT": ["MALTA"],
+    "MD": ["MOLDOVA"],
+    "NO": ["NORWAY"],
+    "PL": ["POLAND"],
+    "RS": ["SERBIA"],
+    "SK": ["SLOVACCHIA"],
+    "ES": ["SPAIN"],
+    "CH": ["SVIZZERA", "SWITZERLAND"],
+    "SE": ["SWEDEN"],
+    "TR": ["TURKEY"],
+    "UA": ["UKRAINE"],
+}
+_COUNTRY_LOOKUP = invert_mapping(COUNTRY_REPLACEMENT_MAPPING)
 
 
 def normalize_country_series(col, sep=None):
@@ -340,64 +850,12 @@ def normalize_country_series(col, sep=None):
     Authors:
         Tue Nguyen
     """
-    # Default value for location separators if not provided
-    if not sep:
-        sep = "[-,;(/[]"
-
-    # Replacement mapping in the format replace_by:to_replace
-    replacement_mapping = {
-        "IT": [
-            "ITALY",
-            "ITALIA",
-            "ITALT",
-            "ITALY",
-            "ITLAY",
-            "`ITALY",
-            "ITALIA O SVIZZERA",
-            "IRALT",
-            "MILAN",
-            "ROMA",
-            "VENETO",
-        ],
-        "AR": ["ARGENTINA"],
-        "AU": ["AUSTRALIA"],
-        "BE": ["BELGIO"],
-        "FR": ["FRANCE"],
-        "DE": ["GERMANY"],
-        "HU": ["HUNGARY"],
-        "IE": ["IRELAND"],
-        "IL": ["ISRAEL"],
-        "JP": ["JO"],
-        "GB": ["LONDON", "SCOZIA", "UK", "UNITED KINGDOM"],
-        "US": ["USA"],
-        "LU": ["LUXEMBOURG"],
-        "MT": ["MALTA"],
-        "MD": ["MOLDOVA"],
-        "NO": ["NORWAY"],
-        "PL": ["POLAND"],
-        "RS": ["SERBIA"],
-        "SK": ["SLOVACCHIA"],
-        "ES": ["SPAIN"],
-        "CH": ["SVIZZERA", "SWITZERLAND"],
-        "SE": ["SWEDEN"],
-        "TR": ["TURKEY"],
-        "UA": ["UKRAINE"],
-    }
-
-    # Explode each cell separate locations and standardize them
-    locations = (
-        col.str.split(sep)
-        .explode()
-        .str.strip()
-        .str.upper()
-        .replace([""], np.nan, regex=False)
-    )
+    return _normalize_tokens(col, sep or _LOCATION_SEP_RE, lookup=_COUNTRY_LOOKUP)
 
-    # Perform replacement
-    locations = replace_series(locations, replacement_mapping)
-    locations = squeeze_series(locations)
 
-    return locations
+# Default token separators, and the same with "/" for job categories and benefits
+_STR_SEP_RE = re.compile("[,;]")
+_STR_SLASH_SEP_RE = re.compile("[/,;]")
 
 
 def normalize_str_separated_series(s, sep=None):
@@ -406,7 +864,7 @@ def normalize_str_separated_series(s, sep=None):
 
     Args:
         s (series): a series to normalize.
-        sep (str): separator.
+        sep (str or re.Pattern): regex for token separators.
 
     Returns:
         A normalized series.
@@ -415,12 +873,199 @@ def normalize_str_separated_series(s, sep=None):
         Tue Nguyen
     """
     if not sep:
-        sep = "[,;]"
+        sep = _STR_SEP_RE
 
-    s = s.str.split(sep).explode().str.strip().str.upper()
+    # Arrow compiles the regex itself, from its source string
+    s = to_arrow_string(s).str.split(getattr(sep, "pattern", sep), regex=True)
+    s = s.explode().str.strip().str.upper()
     return squeeze_series(s)
 
 
+# Replacement mapping in the format replace_by:to_replace
+SKILLS_REPLACEMENT_MAPPING = {
+    "BIG DATA": ["BIGDATA"],
+    "SPARK": ["APACHE SPARK", "SPARQL"],
+    "ARTIFICIAL INTELLIGENCE": ["AI"],
+    "AZURE": ["AZURE AD", "AZURE PLATFORM"],
+    "BASH": ["BASH SCRIPTING"],
+    "DATA SCIENCE": ["DATA SCIENTIST"],
+    "DATA VISUALIZATION": ["DATA VISUALISATION"],
+    "BUSINESS ANALYSIS": ["BUSINESS ANALYST"],
+    "BUSINESS INTELLIGENCE": ["BI MICROSOFT", "BI"],
+    "CONFIGURATION": ["CONFIGURATION AND MONITORING"],
+    "SW DEVELOPMENT": [
+        "DEVELOPERS",
+        "DEVELOPER",
+        "ENGINEERING AND SOFTWARE ARCHITECTURE DESIGN",
+    ],
+    "DIGITAL INTELLIGENCE": ["DI"],
+    "FINTECH": ["FINTECH ANALYSIS"],
+    "HTML": ["HTML5"],
+    "JSON": ["JSON LIBRARIES"],
+    "LEAD": [
+        "LEADERSHIP AND COLLABORATION",
+        "TEAM LEADER",
+        "TEAM MANAGEMENT",
+        "TECHNICAL LEAD",
+    ],
+    "MARKETING": ["MARKETO"],
+    "DATA": ["MASTER DATA", "DATA OFFICER", "DATA ROADMAP"],
+    "DATA MANAGEMENT": ["MASTER DATA MANAGEMENT", "DATA MANAGER"],
+    "PYTHON": ["PHYTON", "PYTHONI", "SKILLS:\xa0PYTHON"],
+    "QLIK": ["QLIKVIEW"],
+    "PREDICTIVE ANALYSIS": ["PREDICTIVE"],
+    "NOSQL": ["REDIS AND OTHER NOSQL DATA BASE"],
+    "PROJECT MANAGEMENT": ["PROJECT MANAGER", "PROJECT MANAGERS"],
+    "SQL": [
+        "MICROSOFT SQL SERVER",
+        "MICROSOFT SQLSERVER",
+        "DB2",
+        "ORACLEDB",
+        "POSTGRESQL",
+        "MYSQL",
+        "RDBMS",
+        "DATABASE MYSQL",
+        "DATABASE SQL",
+        "POSTEGRESQL",
+        "POSTGERSQL",
+        "POSTGESQL",
+    ],
+    "MOBILE": ["MOBILE APPS", "MOBILE FRAMEWORKS"],
+    "NLP": ["NATURAL LANGUAGE UNDERSTANDING", "NATURAL LANGUAGE PROCESSING"],
+    "CLOUD": [
+        "CLOUD COMPUTING",
+        "CLOUD DEVELOPMENT",
+        "GOOGLE CLOUD",
+        "GOOGLE CLOUD PLATFORM",
+        "MINIMAL EXPERIENCE WITH CLOUD ADMIN",
+    ],
+    "FUNCTIONAL ANALYSIS": [
+        "FUNCTIONAL ANALYST",
+        "FUNCTIONAL ANALYSYS",
+        "ANALISTA FUNZIONALE",
+    ],
+    "CONSULTANCY": [
+        "CONSULENTE",
+        "CONSULTANTS",
+        "CONSULTANT",
+        "CONSULTING",
+        "CONSULTATIVE BUSINESS DEVELOPMENT",
+        "SKILLS: CONSULTING",
+        "SENIOR CONSULTANT",
+    ],
+    "RESOURCE DESCRIPTION FRAMEWORK": ["RDF"],
+    "API;REST": ["API GATEWAY", "API REST", "REST"],
+    "SAP": [
+        "SAP BW",
+        "SAP APO",
+        "SAP BI",
+        "SAP BO",
+        "SAP BPC",
+        "SAP CO",
+        "SAP CRM",
+        "SAP FI",
+        "SAP HANA",
+        "SAP MM",
+        "SAP PP",
+        "SAP SD",
+        "SAP SYCLO",
+        "4HANA",
+    ],
+    "ACCENTURE": ["ACCENTURE INTERACTIVE"],
+    "AGILE": ["AGILE SOFTWARE DEVELOPMENT"],
+    "ANDROID": ["ANDROID DEVELOPMENT", "ANDRIOD", "ANDORID", "ANDR", "ANDRIOD SDK"],
+    "ANGULAR JS": [
+        "ANGULAR.JS",
+        "ANGULAR2",
+        "ANGULARJS",
+        "ANGOLARJS",
+        "ANGULA",
+        "ANGULSRJS",
+    ],
+    "ASSET MANAGEMENT": ["AM"],
+    "AWS;AZURE": ["AWS OR AZURE"],
+    "BLOCKCHAIN": ["BLOCKCHAIN DEVELOPMENT"],
+    "BLUE PRISM;AUTOMATION ANYWHERE": ["BLUE PRISM OR AUTOMATION ANYWHERE"],
+    "CARD PAYMENTS;CASHLESS PAYMENTS": ["CARDS", "CASHLESS PAYMENTS"],
+    "CHIEF DATA OFFICER": ["CDO"],
+    "CSS": ["CSS3", "CASCADING STYLE SHEETS"],
+    "D3 JS": ["D3", "D3JS"],
+    "DATA ENGINEERING": ["DATA ENGINEER"],
+    "DATA GOVERNANCE": ["DATA GOVERNANCE SOFTWARE"],
+    "SECURITY": [
+        "IT SECURITY",
+        "DEFINE AND SUPPORT IT SECURITY POLICY",
+        "KNOWLEDGE OF SECURITY SYSTEMS AND ARCHITECTURES",
+        "SECURITY",
+    ],
+    "DISTRIBUTED COMPUTING": ["DISTRIBUTED ARCHITECTURES"],
+    "DOCKER;KUBERNETES": ["DOCKER OR KUBERNETES"],
+    "DATA WAREHOUSING": ["DWH"],
+    "WEB": [
+        "E UN WEB ARCHITECT",
+        "WEBLOGIC 103",
+        "STANNO CERCANDO 2 BACK END E 2 FULL STACK DEVELOPER",
+    ],
+    "CLOUD;AWS;E2C": ["EC2"],
+    "BLOCKCHAIN;ETHEREUM": ["ETHEREUM"],
+    "FINANCE;FINANCIAL ANALYSIS": ["FINANCIAL ANALYSIS"],
+    "FINANCE;FINANCIAL FRAMEWORKS": ["FINANCIAL FRAMEWORKS"],
+    "GIT;REACT": ["GIT AND A MINUMUM OF 2 YEARS EXPERIENCE WITH REACT"],
+    "GIT": ["GITHUB"],
+    "HADOOP": ["HDFS", "HADHOOP", "HADO"],
+    "IT": ["INFORMATICA", "IT SUPPORT ON MAC AND MICROSOFT HARDWARE"],
+    "INFRASTRUCTURE": [
+        "INFRASTRUCTURE EXPERIENCE",
+        "INFRASTRUCTURE INTEGRATION",
+        "SYSTEM INTEGRATIONS",
+    ],
+    "ISO 27001;IT SECURITY": ["ISO 27001", "ISO27001LA", "IEC 27001"],
+    "JAVA": ["JAVA EE", "RXJAVA", "SKILLS: JAVA", "J2EE"],
+    "JAVASCRIPT": ["JS"],
+    "MICROSOFT BI;BUSINESS INTELLIGENCE": ["MICROSOFT BI"],
+    "POWER BI;BUSINESS INTELLIGENCE": ["POWER BI"],
+    "MONGODB": ["MONGO"],
+    "MICROSOFT AD": ["MS AD AUTHENTICATION"],
+    "NEGOTIATION": ["CONTRACT AND VENDOR NEGOTIATIONS", "NEGOTIATIONS"],
+    "SALES": ["PRESALES", "PRE SALES", "PRE-SALES AND BUDGET MANAGEMENT"],
+    "PROJECT MANAGEMENT;PRODUCT MANAGEMENT": ["PROJECT AND PRODUCT MANAGEMENT"],
+    "RECOMMENDATION": ["RECCOMENDATION"],
+    "ROBOTIC": ["ROBOTIC PROCESS AUTOMATION"],
+    "AWS S3;AWS": ["S3"],
+    "SALESFORCE": ["SALESFORCECOM"],
+    "SAS": ["SAS VISUAL ANALYTICS", "SASS"],
+    "PYTHON;SCIKITLEARN": ["SCIKITLEARN"],
+    "PYTHON;SCIPY": ["SCIPY"],
+    "STATISTICS": ["STATISTICAL ANALYSIS"],
+    "SWIFT": ["SWIFT 5", "SWIFT SECURITY PROGRAMME"],
+    "VIRTUAL MACHINES": ["VIRTUAL MACHINES"],
+    "SECURITY;VULNERABILITY ASSESSMENT": ["VULNERABILITY ASSESSMENT"],
+    "SECURITY;VULNERABILITY MANAGEMENT": ["VULNERABILITY MANAGEMENT"],
+    "VUE JS": ["VUE"],
+    "WEBPACK": ["WEBPACK OR SIMILAR TOOLS"],
+    "WEBSHEPERE": ["WEBSHEPERE 7"],
+    "PIG;SPARK": ["PIG AND SPARK"],
+    "ANALYSIS": ["ANALYSE", "ANALYSING"],
+    "BOOTSTRAP": [
+        "BOOTSRAP",
+        "BOOTRSTRAPS",
+        "BOOTRSTRAPS",
+        "BOOSTRAPCSS",
+        "BOOTSTR",
+        "BOOTSTR",
+        "BOOST",
+    ],
+    "CASSANDRA": ["CASANDRA"],
+    "DATABASE": ["DBMS", "DBASE", "DBA"],
+    "MICROSOFT": ["MICOROSOFT", "MICORSOFT", "MICORSOFT EXCEL"],
+}
+_SKILLS_LOOKUP = invert_mapping(SKILLS_REPLACEMENT_MAPPING)
+
+# Default skill separators, and brackets, dots and quotes to remove from skills
+_SKILL_SEP_RE = re.compile("[;,(/&]")
+_SKILL_CLEAN_RE = re.compile(r"[)\]?.\"']")
+
+
 def normalize_skills_series(col, sep=None):
     """
     Normalizes skills column.
@@ -435,207 +1080,314 @@ def normalize_skills_series(col, sep=None):
     Authors:
         Tue Nguyen
     """
-    # Default value for location separators if not provided
-    if not sep:
-        sep = "[;,(/&]"
-
-    # Replacement mapping in the format replace_by:to_replace
-    replacement_mapping = {
-        "BIG DATA": ["BIGDATA"],
-        "SPARK": ["APACHE SPARK", "SPARQL"],
-        "ARTIFICIAL INTELLIGENCE": ["AI"],
-        "AZURE": ["AZURE AD", "AZURE PLATFORM"],
-        "BASH": ["BASH SCRIPTING"],
-        "DATA SCIENCE": ["DATA SCIENTIST"],
-        "DATA VISUALIZATION": ["DATA VISUALISATION"],
-        "BUSINESS ANALYSIS": ["BUSINESS ANALYST"],
-        "BUSINESS INTELLIGENCE": ["BI MICROSOFT", "BI"],
-        "CONFIGURATION": ["CONFIGURATION AND MONITORING"],
-        "SW DEVELOPMENT": [
-            "DEVELOPERS",
-            "DEVELOPER",
-            "ENGINEERING AND SOFTWARE ARCHITECTURE DESIGN",
-        ],
-        "DIGITAL INTELLIGENCE": ["DI"],
-        "FINTECH": ["FINTECH ANALYSIS"],
-        "HTML": ["HTML5"],
-        "JSON": ["JSON LIBRARIES"],
-        "LEAD": [
-            "LEADERSHIP AND COLLABORATION",
-            "TEAM LEADER",
-            "TEAM MANAGEMENT",
-            "TECHNICAL LEAD",
-        ],
-        "MARKETING": ["MARKETO"],
-        "DATA": ["MASTER DATA", "DATA OFFICER", "DATA ROADMAP"],
-        "DATA MANAGEMENT": ["MASTER DATA MANAGEMENT", "DATA MANAGER"],
-        "PYTHON": ["PHYTON", "PYTHONI", "SKILLS:\xa0PYTHON"],
-        "QLIK": ["QLIKVIEW"],
-        "PREDICTIVE ANALYSIS": ["PREDICTIVE"],
-        "NOSQL": ["REDIS AND OTHER NOSQL DATA BASE"],
-        "PROJECT MANAGEMENT": ["PROJECT MANAGER", "PROJECT MANAGERS"],
-        "SQL": [
-            "MICROSOFT SQL SERVER",
-            "MICROSOFT SQLSERVER",
-            "DB2",
-            "ORACLEDB",
-            "POSTGRESQL",
-            "MYSQL",
-            "RDBMS",
-            "DATABASE MYSQL",
-            "DATABASE SQL",
-            "POSTEGRESQL",
-            "POSTGERSQL",
-            "POSTGESQL",
-        ],
-        "MOBILE": ["MOBILE APPS", "MOBILE FRAMEWORKS"],
-        "NLP": ["NATURAL LANGUAGE UNDERSTANDING", "NATURAL LANGUAGE PROCESSING"],
-        "CLOUD": [
-            "CLOUD COMPUTING",
-            "CLOUD DEVELOPMENT",
-            "GOOGLE CLOUD",
-            "GOOGLE CLOUD PLATFORM",
-            "MINIMAL EXPERIENCE WITH CLOUD ADMIN",
-        ],
-        "FUNCTIONAL ANALYSIS": [
-            "FUNCTIONAL ANALYST",
-            "FUNCTIONAL ANALYSYS",
-            "ANALISTA FUNZIONALE",
-        ],
-        "CONSULTANCY": [
-            "CONSULENTE",
-            "CONSULTANTS",
-            "CONSULTANT",
-            "CONSULTING",
-            "CONSULTATIVE BUSINESS DEVELOPMENT",
-            "SKILLS: CONSULTING",
-            "SENIOR CONSULTANT",
-        ],
-        "RESOURCE DESCRIPTION FRAMEWORK": ["RDF"],
-        "API;REST": ["API GATEWAY", "API REST", "REST"],
-        "SAP": [
-            "SAP BW",
-            "SAP APO",
-            "SAP BI",
-            "SAP BO",
-            "SAP BPC",
-            "SAP CO",
-            "SAP CRM",
-            "SAP FI",
-            "SAP HANA",
-            "SAP MM",
-            "SAP PP",
-            "SAP SD",
-            "SAP SYCLO",
-            "4HANA",
-        ],
-        "ACCENTURE": ["ACCENTURE INTERACTIVE"],
-        "AGILE": ["AGILE SOFTWARE DEVELOPMENT"],
-        "ANDROID": ["ANDROID DEVELOPMENT", "ANDRIOD", "ANDORID", "ANDR", "ANDRIOD SDK"],
-        "ANGULAR JS": [
-            "ANGULAR.JS",
-            "ANGULAR2",
-            "ANGULARJS",
-            "ANGOLARJS",
-            "ANGULA",
-            "ANGULSRJS",
-        ],
-        "ASSET MANAGEMENT": ["AM"],
-        "AWS;AZURE": ["AWS OR AZURE"],
-        "BLOCKCHAIN": ["BLOCKCHAIN DEVELOPMENT"],
-        "BLUE PRISM;AUTOMATION ANYWHERE": ["BLUE PRISM OR AUTOMATION ANYWHERE"],
-        "CARD PAYMENTS;CASHLESS PAYMENTS": ["CARDS", "CASHLESS PAYMENTS"],
-        "CHIEF DATA OFFICER": ["CDO"],
-        "CSS": ["CSS3", "CASCADING STYLE SHEETS"],
-        "D3 JS": ["D3", "D3JS"],
-        "DATA ENGINEERING": ["DATA ENGINEER"],
-        "DATA GOVERNANCE": ["DATA GOVERNANCE SOFTWARE"],
-        "SECURITY": [
-            "IT SECURITY",
-            "DEFINE AND SUPPORT IT SECURITY POLICY",
-            "KNOWLEDGE OF SECURITY SYSTEMS AND ARCHITECTURES",
-            "SECURITY",
-        ],
-        "DISTRIBUTED COMPUTING": ["DISTRIBUTED ARCHITECTURES"],
-        "DOCKER;KUBERNETES": ["DOCKER OR KUBERNETES"],
-        "DATA WAREHOUSING": ["DWH"],
-        "WEB": [
-            "E UN WEB ARCHITECT",
-            "WEBLOGIC 103",
-            "STANNO CERCANDO 2 BACK END E 2 FULL STACK DEVELOPER",
-        ],
-        "CLOUD;AWS;E2C": ["EC2"],
-        "BLOCKCHAIN;ETHEREUM": ["ETHEREUM"],
-        "FINANCE;FINANCIAL ANALYSIS": ["FINANCIAL ANALYSIS"],
-        "FINANCE;FINANCIAL FRAMEWORKS": ["FINANCIAL FRAMEWORKS"],
-        "GIT;REACT": ["GIT AND A MINUMUM OF 2 YEARS EXPERIENCE WITH REACT"],
-        "GIT": ["GITHUB"],
-        "HADOOP": ["HDFS", "HADHOOP", "HADO"],
-        "IT": ["INFORMATICA", "IT SUPPORT ON MAC AND MICROSOFT HARDWARE"],
-        "INFRASTRUCTURE": [
-            "INFRASTRUCTURE EXPERIENCE",
-            "INFRASTRUCTURE INTEGRATION",
-            "SYSTEM INTEGRATIONS",
-        ],
-        "ISO 27001;IT SECURITY": ["ISO 27001", "ISO27001LA", "IEC 27001"],
-        "JAVA": ["JAVA EE", "RXJAVA", "SKILLS: JAVA", "J2EE"],
-        "JAVASCRIPT": ["JS"],
-        "MICROSOFT BI;BUSINESS INTELLIGENCE": ["MICROSOFT BI"],
-        "POWER BI;BUSINESS INTELLIGENCE": ["POWER BI"],
-        "MONGODB": ["MONGO"],
-        "MICROSOFT AD": ["MS AD AUTHENTICATION"],
-        "NEGOTIATION": ["CONTRACT AND VENDOR NEGOTIATIONS", "NEGOTIATIONS"],
-        "SALES": ["PRESALES", "PRE SALES", "PRE-SALES AND BUDGET MANAGEMENT"],
-        "PROJECT MANAGEMENT;PRODUCT MANAGEMENT": ["PROJECT AND PRODUCT MANAGEMENT"],
-        "RECOMMENDATION": ["RECCOMENDATION"],
-        "ROBOTIC": ["ROBOTIC PROCESS AUTOMATION"],
-        "AWS S3;AWS": ["S3"],
-        "SALESFORCE": ["SALESFORCECOM"],
-        "SAS": ["SAS VISUAL ANALYTICS", "SASS"],
-        "PYTHON;SCIKITLEARN": ["SCIKITLEARN"],
-        "PYTHON;SCIPY": ["SCIPY"],
-        "STATISTICS": ["STATISTICAL ANALYSIS"],
-        "SWIFT": ["SWIFT 5", "SWIFT SECURITY PROGRAMME"],
-        "VIRTUAL MACHINES": ["VIRTUAL MACHINES"],
-        "SECURITY;VULNERABILITY ASSESSMENT": ["VULNERABILITY ASSESSMENT"],
-        "SECURITY;VULNERABILITY MANAGEMENT": ["VULNERABILITY MANAGEMENT"],
-        "VUE JS": ["VUE"],
-        "WEBPACK": ["WEBPACK OR SIMILAR TOOLS"],
-        "WEBSHEPERE": ["WEBSHEPERE 7"],
-        "PIG;SPARK": ["PIG AND SPARK"],
-        "ANALYSIS": ["ANALYSE", "ANALYSING"],
-        "BOOTSTRAP": [
-            "BOOTSRAP",
-            "BOOTRSTRAPS",
-            "BOOTRSTRAPS",
-            "BOOSTRAPCSS",
-            "BOOTSTR",
-            "BOOTSTR",
-            "BOOST",
-        ],
-        "CASSANDRA": ["CASANDRA"],
-        "DATABASE": ["DBMS", "DBASE", "DBA"],
-        "MICROSOFT": ["MICOROSOFT", "MICORSOFT", "MICORSOFT EXCEL"],
-    }
-
-    # Explode each cell separate locations and standardize them
-    skills = (
-        col.str.split(sep)
-        .explode()
-        .replace("[)\]?.]", "", regex=True)
-        .replace('"', "", regex=True)
-        .replace("'", "", regex=True)
-        .str.strip()
-        .str.upper()
-        .replace([""], np.nan, regex=False)
+    return _normalize_tokens(
+        col, sep or _SKILL_SEP_RE, cleanup=_SKILL_CLEAN_RE, lookup=_SKILLS_LOOKUP
     )
 
-    # Perform replacement and squeeze
-    skills = replace_series(skills, replacement_mapping)
-    skills = skills.str.split(";").explode().str.strip()
-    skills = squeeze_series(skills)
 
-    return skills
+# Replacement mapping in the format prefix:replace_by
+SKILLS_PREFIX_MAPPING = {
+    "2G NET": "2G NETWORKS",
+    "3G NET": "3G NETWORKS",
+    "4G NET": "4G NETWORKS",
+    "5G NET": "5G NETWORKS",
+    "6G NET": "6G NETWORKS",
+    "3D STUDIO": "3D STUDIO",
+    "ACCEPTANCE TEST": "ACCEPTANCE TEST",
+    "ACTIONSCR": "ACTIONSCRIPT",
+    "ACTIVE DI": "ACTIVE DIRECTORY",
+    "ACTIVE S": "ACTIVE SERVER",
+    "ACTIVE TEMPLATE": "ACTIVE TEMPLATE",
+    "ACTIVEMATRI": "ACTIVEMATRIX ",
+    "ACTIVITI": "ACTIVITI",
+    "AD HOC": "ADHOC ANALYSIS",
+    "ADHOC": "ADHOC ANALYSIS",
+    "AD ": "ADVERTISEMENT",
+    "ADA ": "ADA",
+    "ADABAS ": "ADABAS",
+    "ADOBE ": "ADOBE",
+    "AGILE ": "AGILE",
+    "AJAX ": "AJAX",
+    "AKKA ": "AKKA",
+    "ALGO": "ALGORITHMS",
+    "ALL IT": "IT",
+    "ALTOVA ": "ALTOVA",
+    "AMAZO": "AWS",
+    "ANDRO": "ANDROID",
+    "ANGULA": "ANGULAR JS",
+    "APACHE HADOOP": "HADOOP",
+    "APACHE HBASE": "HBASE",
+    "APACHE HI": "HIVE",
+    "APACHE K": "KAFKA",
+    "APACHE M": "MAHOUT",
+    "APACHE SP": "SPARK",
+    "APACHE SU": "APACHE SUBVERSION",
+    "APACHE WE": "APACHE WEB SERVER",
+    "API ": "API",
+    "APOLLO ": "APOLLO",
+    "APPLE": "APPLE",
+    "ARTIFIC": "ARTIFICIAL INTELLIGENCE",
+    "ASCENTIAL": "ASCENTIAL DATASTAGE",
+    "ASPEN ": "ASPEN",
+    "ASSET ": "ASSET MANAGEMENT",
+    "ASYNCHR": "ASYNCHRONOUS TRANSFER MODE",
+    "ATLASSIAN": "ATLASSIAN",
+    "AUTODESK": "AUTODESK",
+    "AWS ": "AWS",
+    "AZURE ": "AZURE",
+    "BACK-END": "BACK END",
+    "BACKBONE NETWORKS": "BACKBONE NETWORKS",
+    "BALSAMIC": "BALSAMIQ",
+    "BASE SAS": "SAS",
+    "BEX ": "BEX",
+    "BIG D": "BIG DATA",
+    "BLOCKCHA": "BLOCKCHAIN",
+    "BLOOMBE": "BLOOMBERG",
+    "BLUETOO": "BLUETOOTH",
+    "BOOTSTRAP": "BOOTSTRAP",
+    "CASCADING STYLE": "CSS",
+    "ARCHITEC": "ARCHITECTURE",
+    "ARDUI": "ARDUINO",
+    "ARM ": "ARM",
+    "ART ": "ART",
+    "ASAP ": "ASAP",
+    "ASP ": "ASP",
+    "BASH ": "BASH",
+    "BEHAVIOUR": "BEHAVIOUR ANALYSIS",
+    "BILLIN": "BILLING SYSTEMS",
+    "BITBUC": "BITBUCKET",
+    "BLACKBERRY": "BLACKBERRY",
+    "BMC ": "BMC",
+    "BOOSTRAP": "BOOTSTRAP",
+    "BOURNE": "BOURNE",
+    "BUSINESS O": "BUSINESS OBJECT",
+    "BUSINESSOB": "BUSINESS OBJECT",
+    "BUSINESS S": "BUSINESS SUPPORT",
+    "C ": "C",
+    "C+": "C++",
+    "CAM ": "CAM",
+    "CASCA": "CSS",
+    "CCS ": "CCS",
+    "CASSANDRA": "CASSANDRA",
+    "CD ": "CD",
+    "CELLULAR ": "CELLULAR",
+    "CENTOS ": "CENTOS",
+    "CGI ": "CGI",
+    "CISCO ": "CISCO",
+    "CITRIX ": "CITRIX",
+    "CLOUD ": "CLOUD",
+    "CLOUDE": "CLOUDERA",
+    "CLUSTER ": "DISTRIBUTED COMPUTING",
+    "CLUSTERS": "DISTRIBUTED COMPUTING",
+    "CMMI": "CMMI",
+    "CMS ": "CMS",
+    "COBOL": "COBOL",
+    "COCOA": "COCOA",
+    "CODEIG": "CODEIGNITER",
+    "COGNOS": "COGNOS",
+    "COMMUNICAT": "COMMUNICATION",
+    "CONSUL": "CONSULTANCY",
+    "CONTENT M": "CONTENT MANAGEMENT",
+    "CONTINUOUS D": "CD",
+    "CONTINUOUS I": "CI",
+    "CRM ": "CRM",
+    "CRUD ": "CRUD",
+    "DATA I": "DATA INTEGRATION",
+    "DATA MIN": "DATA MINING",
+    "DATA MO": "DATA MODELLING",
+    "DATA M": "DATA MANAGEMENT",
+    "DATA PRO": "DATA PROCESSING",
+    "DATA PRE-PROCESSING": "DATA PROCESSING",
+    "DATA QUALITY": "DATA MANAGEMENT",
+    "DATA STORAG": "DATA STORAGE",
+    "DATA TRANS": "DATA TRANSFORMATION",
+    "DATA VI": "DATA VISUALIZATION",
+    "DATA WA": "DATA WAREHOUSING",
+    "DATABASE ": "DATABASE",
+    "DEB": "DEBIAN",
+    "DEEP": "DEEP LEARNING",
+    "DEL ": "DEL",
+    "DEPLOYMENT ": "DEPLOYMENT",
+    "DISTR": "DISTRIBUTED COMPUTING",
+    "DJANGO": "DJANGO",
+    "DOCKER": "DOCKER",
+    "DOJO": "DOJO",
+    "DOMAIN NA": "DNS",
+    "DREAMWEAVER": "DREAMWEAVER",
+    "DRUPAL": "DRUPAL",
+    "E-COMMERCE": "E-COMMERCE",
+    "ECOMME": "E-COMMERCE",
+    "ECLIPSE": "ECLIPSE",
+    "ELASTICSEAR": "ELASTICHSEARCH",
+    "EMBED": "EMBEDDED",
+    "ERP ": "ERP",
+    "ETL ": "ETL",
+    "EXTREME PR": "EXTREME PROGRAMMING",
+    "FIREWA": "FIREWALLS",
+    "FLASH ": "FLASH",
+    "FRONT E": "FRONT END",
+    "FRONTE": "FRONT END",
+    "FTTX ": "FTTX",
+    "FULL ST": "SW DEVELOPMENT",
+    "FUNCTIONAL D": "FUNCTIONAL DESIGN",
+    "FUNCTIONAL PRO": "FUNCTIONAL PROGRAMMING",
+    "FUNCTIONAL RE": "FUNCTIONAL REQUIREMENTS",
+    "GAME ": "GAME",
+    "GEOGRAPHIC I": "GEOGRAPHIC INFORMATION SYSTEMS",
+    "GOOGLE CL": "CLOUD",
+    "GRAPHIC": "GRAPHICS",
+    "GUI ": "GUI",
+    "HADOOP ": "HADOOP",
+    "HANA ": "HANA",
+    "HELPDESK": "HELPDESK",
+    "HIBE": "HIBERNATE",
+    "HP ": "HP",
+    "HTM": "HTML",
+    "HTTP": "HTTP",
+    "HYPERION": "HYPERION",
+    "IBM CLOUD": "CLOUD",
+    "IBM COGNO": "COGNOS",
+    "IBM HA": "IBM HARDWARE",
+    "IBM WEB": "IBM WEBSPHERE",
+    "ICT ": "ICT",
+    "IDEE": "IDEE",
+    "INFORMATICA": "IT",
+    "INFORMATION SEC": "SECURITY",
+    "INFORMATION TEC": "IT",
+    "INTEL ": "INTEL",
+    "INTELLIJ": "INTELLIJ",
+    "INTRUSION": "INTRUSION DETECTION",
+    "IONIC ": "IONIC",
+    "IOT ": "IOT",
+    "IP ": "IP",
+    "IPHONE": "IPHONE",
+    "ISO 27": "SECURITY",
+    "ISO 900X": "ISO 900X",
+    "IT ARCHITECTURE": "IT ARCHITECTURE",
+    "IT INFRASTRUCTURE": "INFRASTRUCTURE",
+    "IT PROJECT": "PROJECT MANAGEMENT",
+    "ITIL": "ITIL",
+    "JAK": "JAKARTA TOMCAT",
+    "JASPER": "JASPER",
+    "JAVA ": "JAVA",
+    "JAVASC": "JAVASCRIPT",
+    "JAVASE": "JAVA SERVER",
+    "JBOS": "JBOSS",
+    "JDE": "JDE",
+    "JIRA ": "JIRA",
+    "JOOM": "JOOMLA",
+    "JQU": "JQUERY",
+    "JSC": "JAVASCRIPT",
+    "JSO": "JSON",
+    "JULIA": "JULIA",
+    "JUPITER": "JUPYTER",
+    "JUPYTER": "JUPYTER",
+    "KAFK": "KAFKA",
+    "KERA": "KERAS",
+    "KNOC": "KNOCKOUT JS",
+    "KORN ": "KORN",
+    "LINU": "LINUX",
+    "LOTUS ": "LOTUS",
+    "LSI ": "LSI",
+    "LUA": "LUA",
+    "MACHINE L": "MACHINE LEARNING",
+    "MACROMEDIA": "MACROMEDIA",
+    "MARKET": "MARKETING ",
+    "MASTER DATA": "DATA",
+    "MATLA": "MATLAB",
+    "MCAFEE": "MCAFEE",
+    "MERCURY ": "MERCURY",
+    "MICROSOFT AS": "ASP",
+    "MICROSOFT C": "C#",
+    "MICROSOFT DY": "MICROSOFT DYNAMICS",
+    "MICROSOFT E": "MS EXCEL",
+    "MS EXCEL": "MS EXCEL",
+    "MICROSOFT OF": "MS OFFICE",
+    "MICROSOFT OU": "MS OUTLOOK",
+    "MICROSOFT PO": "MS POWERPOINT",
+    "MICROSOFT SQ": "SQL",
+    "MICROSOFT TRA": "SQL",
+    "MICROSOFT TEAM": "MS TEAMS",
+    "MICROSOFT VISI": "VISIO",
+    "MICROSOFT VISUAL C": "VISUAL C",
+    "MICROSOFT VISUAL S": "VISUAL STUDIO",
+    "MICROSOFT WI": "WINDOWS",
+    "MICROSOFT WO": "MS WORD",
+    "MOBILE ": "MOBILE",
+    "MVC ": "MVC",
+    "MYSQ": "SQL",
+    "NATURAL LA": "NLP",
+    "NETBEAN": "NETBEANS",
+    "NEURAL NE": "NEURAL NET",
+    "NODE": "NODE JS",
+    "OBJECT ORI": "OOP",
+    "OPERATI": "OS",
+    "ORACLE ": "ORACLE",
+    "PHP ": "PHP",
+    "POSTGR": "SQL",
+    "PROJECT MANAGEMENT": "PROJECT MANAGEMENT",
+    "PYTH": "PYTHON",
+    "PYTOR": "PYTORCH",
+    "QLIK": "QLIK",
+    "R ": "R",
+    "REACT": "REACT JS",
+    "RECOVERY": "RECOVERY",
+    "REGRESSION": "REGRESSION",
+    "REGULAR EXP": "REGULAR EXPRESSION",
+    "RELATIONAL": "SQL",
+    "REST ": "API",
+    "RUBY": "RUBY",
+    "SAGE ": "SAGE",
+    "SALESFORCE": "SALESFORCE",
+    "SALES ": "SALES",
+    "SAP ": "SAP",
+    "SAS ": "SAS",
+    "SCALA ": "SCALA",
+    "SCIKI": "SCIKITLEARN",
+    "SCO ": "SCO",
+    "SCRUM": "SCRUM",
+    "SEAGATE ": "SEAGATE",
+    "SEARCH ENG": "SEO",
+    "SECURITY": "SECURITY",
+    "SERVER ": "SERVER ",
+    "SHELL ": "SHELL",
+    "SIEBEL ": "SIEBEL",
+    "SIEMEN": "SIEMENS",
+    "SNOWFLAKE": "SNOWFLAKE",
+    "SOA ": "SOA",
+    "SOAP ": "SOAP",
+    "SOCIAL MED": "SOCIAL MEDIA",
+    "SOFTWARE ": "SW DEVELOPMENT",
+    "SPRING ": "SPRING",
+    "SQL ": "SQL",
+    "STRUTS": "STRUTS",
+    "SUBLIM": "SUBLIME TEXT",
+    "TABLE": "TABLEAU",
+    "TENSORF": "TENSORFLOW",
+    "TERADA": "TERADATA",
+    "TEST ": "TEST",
+    "TIBCO ": "TIBCO",
+    "UBUNT": "UBUNTU",
+    "UI ": "UI",
+    "USER I": "UI",
+    "UNIT T": "TEST",
+    "UNIX": "UNIX",
+    "VISUAL BASIC": "VISUAL BASIC",
+    "VMWARE": "VMWARE",
+    "VULNERABILITY": "VULNERABILITY MANAGEMENT",
+    "WAN ": "WAN",
+    "WEB API": "API",
+    "WEB ": "WEB",
+    "WEBSPHERE": "WEBSPHERE",
+    "WINDOWS AZ": "AZURE",
+    "WIN ": "WINDOWS",
+    "WINDOW": "WINDOWS",
+    "ZEND": "ZEND",
+    "PERSONAL HOME PAGE": "PHP",
+}
+_SKILLS_PREFIX_PATTERN, _SKILLS_PREFIX_LOOKUP = compile_prefix_mapping(
+    SKILLS_PREFIX_MAPPING
+)
 
 
 def normalize_skills_series_extra(s, sep=None):
@@ -648,320 +1400,23 @@ def normalize_skills_series_extra(s, sep=None):
     Returns:
         A series
     """
-    # Normalize first steps
-    s = normalize_skills_series(s, sep=sep)
-
-    # Replacement mapping in the format replace_by:to_replace
-    replacement_dict = {
-        "2G NET": "2G NETWORKS",
-        "3G NET": "3G NETWORKS",
-        "4G NET": "4G NETWORKS",
-        "5G NET": "5G NETWORKS",
-        "6G NET": "6G NETWORKS",
-        "3D STUDIO": "3D STUDIO",
-        "ACCEPTANCE TEST": "ACCEPTANCE TEST",
-        "ACTIONSCR": "ACTIONSCRIPT",
-        "ACTIVE DI": "ACTIVE DIRECTORY",
-        "ACTIVE S": "ACTIVE SERVER",
-        "ACTIVE TEMPLATE": "ACTIVE TEMPLATE",
-        "ACTIVEMATRI": "ACTIVEMATRIX ",
-        "ACTIVITI": "ACTIVITI",
-        "AD HOC": "ADHOC ANALYSIS",
-        "ADHOC": "ADHOC ANALYSIS",
-        "AD ": "ADVERTISEMENT",
-        "ADA ": "ADA",
-        "ADABAS ": "ADABAS",
-        "ADOBE ": "ADOBE",
-        "AGILE ": "AGILE",
-        "AJAX ": "AJAX",
-        "AKKA ": "AKKA",
-        "ALGO": "ALGORITHMS",
-        "ALL IT": "IT",
-        "ALTOVA ": "ALTOVA",
-        "AMAZO": "AWS",
-        "ANDRO": "ANDROID",
-        "ANGULA": "ANGULAR JS",
-        "APACHE HADOOP": "HADOOP",
-        "APACHE HBASE": "HBASE",
-        "APACHE HI": "HIVE",
-        "APACHE K": "KAFKA",
-        "APACHE M": "MAHOUT",
-        "APACHE SP": "SPARK",
-        "APACHE SU": "APACHE SUBVERSION",
-        "APACHE WE": "APACHE WEB SERVER",
-        "API ": "API",
-        "APOLLO ": "APOLLO",
-        "APPLE": "APPLE",
-        "ARTIFIC": "ARTIFICIAL INTELLIGENCE",
-        "ASCENTIAL": "ASCENTIAL DATASTAGE",
-        "ASPEN ": "ASPEN",
-        "ASSET ": "ASSET MANAGEMENT",
-        "ASYNCHR": "ASYNCHRONOUS TRANSFER MODE",
-        "ATLASSIAN": "ATLASSIAN",
-        "AUTODESK": "AUTODESK",
-        "AWS ": "AWS",
-        "AZURE ": "AZURE",
-        "BACK-END": "BACK END",
-        "BACKBONE NETWORKS": "BACKBONE NETWORKS",
-        "BALSAMIC": "BALSAMIQ",
-        "BASE SAS": "SAS",
-        "BEX ": "BEX",
-        "BIG D": "BIG DATA",
-        "BLOCKCHA": "BLOCKCHAIN",
-        "BLOOMBE": "BLOOMBERG",
-        "BLUETOO": "BLUETOOTH",
-        "BOOTSTRAP": "BOOTSTRAP",
-        "CASCADING STYLE": "CSS",
-        "ARCHITEC": "ARCHITECTURE",
-        "ARDUI": "ARDUINO",
-        "ARM ": "ARM",
-        "ART ": "ART",
-        "ASAP ": "ASAP",
-        "ASP ": "ASP",
-        "BASH ": "BASH",
-        "BEHAVIOUR": "BEHAVIOUR ANALYSIS",
-        "BILLIN": "BILLING SYSTEMS",
-        "BITBUC": "BITBUCKET",
-        "BLACKBERRY": "BLACKBERRY",
-        "BMC ": "BMC",
-        "BOOSTRAP": "BOOTSTRAP",
-        "BOURNE": "BOURNE",
-        "BUSINESS O": "BUSINESS OBJECT",
-        "BUSINESSOB": "BUSINESS OBJECT",
-        "BUSINESS S": "BUSINESS SUPPORT",
-        "C ": "C",
-        "C+": "C++",
-        "CAM ": "CAM",
-        "CASCA": "CSS",
-        "CCS ": "CCS",
-        "CASSANDRA": "CASSANDRA",
-        "CD ": "CD",
-        "CELLULAR ": "CELLULAR",
-        "CENTOS ": "CENTOS",
-        "CGI ": "CGI",
-        "CISCO ": "CISCO",
-        "CITRIX ": "CITRIX",
-        "CLOUD ": "CLOUD",
-        "CLOUDE": "CLOUDERA",
-        "CLUSTER ": "DISTRIBUTED COMPUTING",
-        "CLUSTERS": "DISTRIBUTED COMPUTING",
-        "CMMI": "CMMI",
-        "CMS ": "CMS",
-        "COBOL": "COBOL",
-        "COCOA": "COCOA",
-        "CODEIG": "CODEIGNITER",
-        "COGNOS": "COGNOS",
-        "COMMUNICAT": "COMMUNICATION",
-        "CONSUL": "CONSULTANCY",
-        "CONTENT M": "CONTENT MANAGEMENT",
-        "CONTINUOUS D": "CD",
-        "CONTINUOUS I": "CI",
-        "CRM ": "CRM",
-        "CRUD ": "CRUD",
-        "DATA I": "DATA INTEGRATION",
-        "DATA MIN": "DATA MINING",
-        "DATA MO": "DATA MODELLING",
-        "DATA M": "DATA MANAGEMENT",
-        "DATA PRO": "DATA PROCESSING",
-        "DATA PRE-PROCESSING": "DATA PROCESSING",
-        "DATA QUALITY": "DATA MANAGEMENT",
-        "DATA STORAG": "DATA STORAGE",
-        "DATA TRANS": "DATA TRANSFORMATION",
-        "DATA VI": "DATA VISUALIZATION",
-        "DATA WA": "DATA WAREHOUSING",
-        "DATABASE ": "DATABASE",
-        "DEB": "DEBIAN",
-        "DEEP": "DEEP LEARNING",
-        "DEL ": "DEL",
-        "DEPLOYMENT ": "DEPLOYMENT",
-        "DISTR": "DISTRIBUTED COMPUTING",
-        "DJANGO": "DJANGO",
-        "DOCKER": "DOCKER",
-        "DOJO": "DOJO",
-        "DOMAIN NA": "DNS",
-        "DREAMWEAVER": "DREAMWEAVER",
-        "DRUPAL": "DRUPAL",
-        "E-COMMERCE": "E-COMMERCE",
-        "ECOMME": "E-COMMERCE",
-        "ECLIPSE": "ECLIPSE",
-        "ELASTICSEAR": "ELASTICHSEARCH",
-        "EMBED": "EMBEDDED",
-        "ERP ": "ERP",
-        "ETL ": "ETL",
-        "EXTREME PR": "EXTREME PROGRAMMING",
-        "FIREWA": "FIREWALLS",
-        "FLASH ": "FLASH",
-        "FRONT E": "FRONT END",
-        "FRONTE": "FRONT END",
-        "FTTX ": "FTTX",
-        "FULL ST": "SW DEVELOPMENT",
-        "FUNCTIONAL D": "FUNCTIONAL DESIGN",
-        "FUNCTIONAL PRO": "FUNCTIONAL PROGRAMMING",
-        "FUNCTIONAL RE": "FUNCTIONAL REQUIREMENTS",
-        "GAME ": "GAME",
-        "GEOGRAPHIC I": "GEOGRAPHIC INFORMATION SYSTEMS",
-        "GOOGLE CL": "CLOUD",
-        "GRAPHIC": "GRAPHICS",
-        "GUI ": "GUI",
-        "HADOOP ": "HADOOP",
-        "HANA ": "HANA",
-        "HELPDESK": "HELPDESK",
-        "HIBE": "HIBERNATE",
-        "HP ": "HP",
-        "HTM": "HTML",
-        "HTTP": "HTTP",
-        "HYPERION": "HYPERION",
-        "IBM CLOUD": "CLOUD",
-        "IBM COGNO": "COGNOS",
-        "IBM HA": "IBM HARDWARE",
-        "IBM WEB": "IBM WEBSPHERE",
-        "ICT ": "ICT",
-        "IDEE": "IDEE",
-        "INFORMATICA": "IT",
-        "INFORMATION SEC": "SECURITY",
-        "INFORMATION TEC": "IT",
-        "INTEL ": "INTEL",
-        "INTELLIJ": "INTELLIJ",
-        "INTRUSION": "INTRUSION DETECTION",
-        "IONIC ": "IONIC",
-        "IOT ": "IOT",
-        "IP ": "IP",
-        "IPHONE": "IPHONE",
-        "ISO 27": "SECURITY",
-        "ISO 900X": "ISO 900X",
-        "IT ARCHITECTURE": "IT ARCHITECTURE",
-        "IT INFRASTRUCTURE": "INFRASTRUCTURE",
-        "IT PROJECT": "PROJECT MANAGEMENT",
-        "ITIL": "ITIL",
-        "JAK": "JAKARTA TOMCAT",
-        "JASPER": "JASPER",
-        "JAVA ": "JAVA",
-        "JAVASC": "JAVASCRIPT",
-        "JAVASE": "JAVA SERVER",
-        "JBOS": "JBOSS",
-        "JDE": "JDE",
-        "JIRA ": "JIRA",
-        "JOOM": "JOOMLA",
-        "JQU": "JQUERY",
-        "JSC": "JAVASCRIPT",
-        "JSO": "JSON",
-        "JULIA": "JULIA",
-        "JUPITER": "JUPYTER",
-        "JUPYTER": "JUPYTER",
-        "KAFK": "KAFKA",
-        "KERA": "KERAS",
-        "KNOC": "KNOCKOUT JS",
-        "KORN ": "KORN",
-        "LINU": "LINUX",
-        "LOTUS ": "LOTUS",
-        "LSI ": "LSI",
-        "LUA": "LUA",
-        "MACHINE L": "MACHINE LEARNING",
-        "MACROMEDIA": "MACROMEDIA",
-        "MARKET": "MARKETING ",
-        "MASTER DATA": "DATA",
-        "MATLA": "MATLAB",
-        "MCAFEE": "MCAFEE",
-        "MERCURY ": "MERCURY",
-        "MICROSOFT AS": "ASP",
-        "MICROSOFT C": "C#",
-        "MICROSOFT DY": "MICROSOFT DYNAMICS",
-        "MICROSOFT E": "MS EXCEL",
-        "MS EXCEL": "MS EXCEL",
-        "MICROSOFT OF": "MS OFFICE",
-        "MICROSOFT OU": "MS OUTLOOK",
-        "MICROSOFT PO": "MS POWERPOINT",
-        "MICROSOFT SQ": "SQL",
-        "MICROSOFT TRA": "SQL",
-        "MICROSOFT TEAM": "MS TEAMS",
-        "MICROSOFT VISI": "VISIO",
-        "MICROSOFT VISUAL C": "VISUAL C",
-        "MICROSOFT VISUAL S": "VISUAL STUDIO",
-        "MICROSOFT WI": "WINDOWS",
-        "MICROSOFT WO": "MS WORD",
-        "MOBILE ": "MOBILE",
-        "MVC ": "MVC",
-        "MYSQ": "SQL",
-        "NATURAL LA": "NLP",
-        "NETBEAN": "NETBEANS",
-        "NEURAL NE": "NEURAL NET",
-        "NODE": "NODE JS",
-        "OBJECT ORI": "OOP",
-        "OPERATI": "OS",
-        "ORACLE ": "ORACLE",
-        "PHP ": "PHP",
-        "POSTGR": "SQL",
-        "PROJECT MANAGEMENT": "PROJECT MANAGEMENT",
-        "PYTH": "PYTHON",
-        "PYTOR": "PYTORCH",
-        "QLIK": "QLIK",
-        "R ": "R",
-        "REACT": "REACT JS",
-        "RECOVERY": "RECOVERY",
-        "REGRESSION": "REGRESSION",
-        "REGULAR EXP": "REGULAR EXPRESSION",
-        "RELATIONAL": "SQL",
-        "REST ": "API",
-        "RUBY": "RUBY",
-        "SAGE ": "SAGE",
-        "SALESFORCE": "SALESFORCE",
-        "SALES ": "SALES",
-        "SAP ": "SAP",
-        "SAS ": "SAS",
-        "SCALA ": "SCALA",
-        "SCIKI": "SCIKITLEARN",
-        "SCO ": "SCO",
-        "SCRUM": "SCRUM",
-        "SEAGATE ": "SEAGATE",
-        "SEARCH ENG": "SEO",
-        "SECURITY": "SECURITY",
-        "SERVER ": "SERVER ",
-        "SHELL ": "SHELL",
-        "SIEBEL ": "SIEBEL",
-        "SIEMEN": "SIEMENS",
-        "SNOWFLAKE": "SNOWFLAKE",
-        "SOA ": "SOA",
-        "SOAP ": "SOAP",
-        "SOCIAL MED": "SOCIAL MEDIA",
-        "SOFTWARE ": "SW DEVELOPMENT",
-        "SPRING ": "SPRING",
-        "SQL ": "SQL",
-        "STRUTS": "STRUTS",
-        "SUBLIM": "SUBLIME TEXT",
-        "TABLE": "TABLEAU",
-        "TENSORF": "TENSORFLOW",
-        "TERADA": "TERADATA",
-        "TEST ": "TEST",
-        "TIBCO ": "TIBCO",
-        "UBUNT": "UBUNTU",
-        "UI ": "UI",
-        "USER I": "UI",
-        "UNIT T": "TEST",
-        "UNIX": "UNIX",
-        "VISUAL BASIC": "VISUAL BASIC",
-        "VMWARE": "VMWARE",
-        "VULNERABILITY": "VULNERABILITY MANAGEMENT",
-        "WAN ": "WAN",
-        "WEB API": "API",
-        "WEB ": "WEB",
-        "WEBSPHERE": "WEBSPHERE",
-        "WINDOWS AZ": "AZURE",
-        "WIN ": "WINDOWS",
-        "WINDOW": "WINDOWS",
-        "ZEND": "ZEND",
-        "PERSONAL HOME PAGE": "PHP",
-    }
+    # Normalize first steps, keeping one skill per row
+    s = explode_normalize(
+        s, sep or _SKILL_SEP_RE, cleanup=_SKILL_CLEAN_RE, lookup=_SKILLS_LOOKUP
+    )
 
-    # Explode each cell separate locations and standardize them
-    s = s.str.split(";").explode()
-    for k, v in replacement_dict.items():
-        s = s.apply(lambda e: replace_if_startswith(e, k, v))
+    # Standardize skills by prefix
+    s = replace_series_by_prefix(s, _SKILLS_PREFIX_PATTERN, _SKILLS_PREFIX_LOOKUP)
 
     s = squeeze_series(s)
 
     return s
 
 
+# Exchange rates to EUR in the format currency_code:rate
+EUR_EXCHANGE_RATES = {"EUR": 1, "GBP": 1.13, "CHF": 1.02, "USD": 0.91}
+
+
 def get_eur_amount(amount, currency_code):
     """
     Get EUR equivalent amount based on amount and currency_code.
@@ -976,12 +1431,33 @@ def get_eur_amount(amount, currency_code):
     Authors:
         Tue Nguyen
     """
-    exchange_rates = {"EUR": 1, "GBP": 1.13, "CHF": 1.02, "USD": 0.91}
-    rate = exchange_rates.get(currency_code, 1)
+    rate = EUR_EXCHANGE_RATES.get(currency_code, 1)
 
     return rate * amount
 
 
+def get_eur_rates(currency):
+    """
+    Gets the EUR exchange rate of each element of a series of currency codes.
+
+    Args:
+        currency (series): a series of currency codes.
+
+    Returns:
+        A numpy array of rates.
+    """
+    # Look up the rate once per distinct currency. Unknown currencies are kept
+    # as is, as in get_eur_amount, and so are missing ones (code -1 takes the
+    # extra rate of 1 at the end).
+    if isinstance(currency.dtype, pd.CategoricalDtype):
+        codes, currencies = currency.cat.codes.to_numpy(), currency.cat.categories
+    else:
+        codes, currencies = pd.factorize(currency)
+    rates = np.array([EUR_EXCHANGE_RATES.get(c, 1) for c in currencies] + [1.0])
+
+    return rates[codes]
+
+
 def get_eur_amount_series(df, amount_col, currency_col):
     """
     Generates a series with EUR equivalent amount from amount_col
@@ -992,9 +1468,7 @@ def get_eur_amount_series(df, amount_col, currency_col):
         amount_col (float): name of original amount column.
         currency_col (str): name of currency column
     """
-    return df.apply(
-        lambda row: get_eur_amount(row[amount_col], row[currency_col]), axis=1
-    )
+    return df[amount_col] * get_eur_rates(df[currency_col])
 
 
 # ==================================================
@@ -1030,7 +1504,12 @@ def clean_organizations():
     # --------------------------------------------------
     # Load data
     # --------------------------------------------------
-    df = read_raw_data(src, col_mapping, low_memory=False)
+    df = read_raw_data(src, col_mapping, dtype={"Id": ARROW_STRING})
+
+    # --------------------------------------------------
+    # Filter rows
+    # --------------------------------------------------
+    df = df.dropna(subset=["org_id"]).reset_index(drop=True)
 
     # --------------------------------------------------
     # Clean columns
@@ -1040,13 +1519,11 @@ def clean_organizations():
     for c in cols:
         df[c] = df[c].str.upper()
 
-    # --------------------------------------------------
-    # Filter rows
-    # --------------------------------------------------
-    df = df.dropna(subset=["org_id"]).reset_index(drop=True)
+    # Store low-cardinality columns as categories
+    to_categorical(df, ["org_industry", "org_type", "org_country"])
 
     # Save
-    df.to_feather(dest)
+    write_feather(df, dest)
 
 
 def clean_candidates():
@@ -1087,7 +1564,17 @@ def clean_candidates():
     # --------------------------------------------------
     # Load data
     # --------------------------------------------------
-    df = read_raw_data(src, col_mapping, low_memory=False)
+    df = read_raw_data(
+        src,
+        col_mapping,
+        dtype={"Id": ARROW_STRING},
+        parse_dates=["CreatedDate"],
+    )
+
+    # --------------------------------------------------
+    # Filter rows
+    # --------------------------------------------------
+    df = df.dropna(subset=["cand_id"]).reset_index(drop=True)
 
     # --------------------------------------------------
     # Clean columns
@@ -1113,13 +1600,11 @@ def clean_candidates():
     # Locations
     df["cand_country"] = normalize_country_series(df["cand_country"])
 
-    # --------------------------------------------------
-    # Filter rows
-    # --------------------------------------------------
-    df = df.dropna(subset=["cand_id"])
+    # Store low-cardinality columns as categories
+    to_categorical(df, ["cand_country"])
 
     # Save
-    df.reset_index(drop=True).to_feather(dest)
+    write_feather(df, dest)
 
 
 def clean_jobs():
@@ -1172,11 +1657,24 @@ def clean_jobs():
         # Date time
         "CreatedDate": "job_created_at",
     }
+    dtype = {
+        "Id": ARROW_STRING,
+        "AVTRRT__Number_of_Positions__c": ARROW_FLOAT,
+        "Fix_Salary__c": ARROW_FLOAT,
+        "Variable_Bonus__c": ARROW_FLOAT,
+        "Commission_Fee__c": ARROW_FLOAT,
+    }
 
     # --------------------------------------------------
     # Load data
     # --------------------------------------------------
-    df = read_raw_data(src, col_mapping)
+    df = read_raw_data(src, col_mapping, dtype=dtype, parse_dates=["CreatedDate"])
+    to_categorical(df, ["job_currency_code"])
+
+    # --------------------------------------------------
+    # Filter rows
+    # --------------------------------------------------
+    df = df.dropna(subset=["job_id"]).reset_index(drop=True)
 
     # --------------------------------------------------
     # Clean columns
@@ -1187,39 +1685,50 @@ def clean_jobs():
     # Clean job skills
     df["job_skills"] = normalize_skills_series(df["job_skills"])
 
-    # Clean money
-    df["job_salary"] = get_eur_amount_series(df, "job_salary", "job_currency_code")
-    df["job_bonus"] = get_eur_amount_series(
-        df, "job_bonus", "job_currency_code"
-    ).fillna(0)
+    # Clean money, converting salary and bonus with the same rates
+    rates = get_eur_rates(df["job_currency_code"])
+    df["job_salary"] = df["job_salary"] * rates
+    df["job_bonus"] = (df["job_bonus"] * rates).fillna(0)
     df["job_total_salary"] = df["job_salary"] + df["job_bonus"]
     df.drop(columns=["job_currency_code"], inplace=True)
 
-    # Clean date
-    df["job_created_at"] = pd.to_datetime(df["job_created_at"])
-
     # Clean OSN practice
-    df["job_osn_practice"] = df["job_osn_practice"].str.upper()
-    other_practices = [np.nan, None, "OSN", "OST"]
-    cond = df["job_osn_practice"].isin(other_practices)
-    df.loc[cond, "job_osn_practice"] = "OTHER"
+    practice = df["job_osn_practice"].str.upper()
+    cond = practice.isna() | practice.isin(["OSN", "OST"])
+    df["job_osn_practice"] = practice.mask(cond, "OTHER")
 
     # Clean title
     df["job_title"] = df["job_title"].str.strip().str.upper()
 
     # Job category
-    df["job_category"] = normalize_str_separated_series(df["job_category"], sep="[/,;]")
+    df["job_category"] = normalize_str_separated_series(
+        df["job_category"], sep=_STR_SLASH_SEP_RE
+    )
 
     # Job benefit
-    df["job_benefit"] = normalize_str_separated_series(df["job_benefit"], sep="[/,;]")
+    df["job_benefit"] = normalize_str_separated_series(
+        df["job_benefit"], sep=_STR_SLASH_SEP_RE
+    )
 
-    # --------------------------------------------------
-    # Filter rows
-    # --------------------------------------------------
-    df = df.dropna(subset=["job_id"]).reset_index(drop=True)
+    # Store numbers in narrow dtypes
+    to_int(df, ["job_n_positions"], pa.int16())
+    cols = ["job_salary", "job_bonus", "job_total_salary", "job_fee"]
+    df[cols] = df[cols].astype(ARROW_FLOAT32)
+
+    # Store low-cardinality columns as categories
+    to_categorical(
+        df,
+        [
+            "job_category",
+            "job_contract",
+            "job_osn_practice",
+            "job_lang_1",
+            "job_lang_2",
+        ],
+    )
 
     # Save
-    df.to_feather(dest)
+    write_feather(df, dest)
 
 
 def clean_applications():
@@ -1259,11 +1768,27 @@ def clean_applications():
         "CreatedDate": "app_created_at",
         "AVTRRT__Resume_Received_Date__c": "app_cv_received_at",
     }
+    dtype = {
+        "Id": ARROW_STRING,
+        "AVTRRT__Account_Job__c": ARROW_STRING,
+        "AVTRRT__Contact_Candidate__c": ARROW_STRING,
+        "AVTRRT__Job__c": ARROW_STRING,
+    }
 
     # --------------------------------------------------
     # Load data
     # --------------------------------------------------
-    df = read_raw_data(src, col_mapping, low_memory=False)
+    df = read_raw_data(
+        src,
+        col_mapping,
+        dtype=dtype,
+        parse_dates=["CreatedDate", "AVTRRT__Resume_Received_Date__c"],
+    )
+
+    # --------------------------------------------------
+    # Filter rows
+    # --------------------------------------------------
+    df = df.dropna(subset=["app_id"]).reset_index(drop=True)
 
     # --------------------------------------------------
     # Clean columns
@@ -1276,18 +1801,11 @@ def clean_applications():
     # City
     df["app_city"] = normalize_city_series(df["app_city"])
 
-    # Date
-    cols = ["app_created_at", "app_cv_received_at"]
-    for c in cols:
-        df[c] = pd.to_datetime(df[c])
-
-    # --------------------------------------------------
-    # Filter rows
-    # --------------------------------------------------
-    df = df.dropna(subset=["app_id"]).reset_index(drop=True)
+    # Store low-cardinality columns as categories
+    to_categorical(df, ["app_stage", "app_contract", "app_reject_qualifier"])
 
     # Save
-    df.to_feather(dest)
+    write_feather(df, dest)
 
 
 def clean_emp_histories():
@@ -1318,11 +1836,24 @@ def clean_emp_histories():
         "AVTRRT__End_Date__c": "hist_end_at",
         "CreatedDate": "hist_created_at",
     }
+    # Start and end dates come in many formats and are parsed by
+    # parse_date_series, so they must stay strings
+    dtype = {
+        "Id": ARROW_STRING,
+        "AVTRRT__Candidate__c": ARROW_STRING,
+        "AVTRRT__Start_Date__c": ARROW_STRING,
+        "AVTRRT__End_Date__c": ARROW_STRING,
+    }
 
     # --------------------------------------------------
     # Load data
     # --------------------------------------------------
-    df = read_raw_data(src, col_mapping)
+    df = read_raw_data(src, col_mapping, dtype=dtype, parse_dates=["CreatedDate"])
+
+    # --------------------------------------------------
+    # Filter rows
+    # --------------------------------------------------
+    df = df.dropna(subset=["hist_id"]).reset_index(drop=True)
 
     # --------------------------------------------------
     # Clean columns
@@ -1330,36 +1861,39 @@ def clean_emp_histories():
     # Clean dates
     cols = ["hist_start_at", "hist_end_at"]
     for c in cols:
-        df[c] = pd.to_datetime(df[c].apply(normalize_date), errors="coerce")
-
-    df["hist_created_at"] = pd.to_datetime(df["hist_created_at"])
-
-    # Add duration in years
-    start = df["hist_start_at"].copy()
-    end = df["hist_end_at"].copy()
-    cond = end.isnull()
-    end.loc[cond] = df.loc[cond, "hist_created_at"]
-    df["hist_years"] = ((end - start).dt.days / 365.0).round(1)
+        df[c] = parse_date_series(df[c])
+
+    # Add duration in years, using the creation date for ongoing jobs. Start
+    # and end are read as views of the columns, only the Arrow-backed creation
+    # date is converted (to the same unit).
+    start = df["hist_start_at"].to_numpy(copy=False)
+    end = df["hist_end_at"].to_numpy(copy=False)
+    created = df["hist_created_at"].to_numpy(end.dtype)
+    end = np.where(np.isnat(end), created, end)
+    days = np.floor((end - start) / np.timedelta64(1, "D"))
+    years = np.round(days / 365.0, 1)
 
     # If hist_months == 0 (same start year and end year), fix it to half of a year
-    cond = df["hist_years"] == 0
-    df.loc[cond, "hist_years"] = 0.5
+    df["hist_years"] = np.where(years == 0, 0.5, years).astype(np.float32)
 
     # Clean orgs
     df["hist_org"] = df["hist_org"].str.strip().str.upper()
 
-    # --------------------------------------------------
-    # Filter rows
-    # --------------------------------------------------
-    df = df.dropna(subset=["hist_id"]).reset_index(drop=True)
-
     # Save
-    df.to_feather(dest)
+    write_feather(df, dest)
 
 
-def clean_all():
+def clean_all(max_workers=None):
     """
-    Cleans all data.
+    Cleans all data. The tables are independent, so their cleaners run
+    concurrently in separate processes. The processes are spawned, so a script
+    calling this must do so under an `if __name__ == "__main__":` guard, unless
+    max_workers is 1.
+
+    Args:
+        max_workers (int): number of processes, defaults to one per cleaner
+            or per CPU, whichever is smaller. With 1, the cleaners run one
+            after another in the current process.
 
     Returns:
         None.
@@ -1367,9 +1901,25 @@ def clean_all():
     Authors:
         Tue Nguyen
     """
-    clean_organizations()
-    clean_candidates()
-    clean_jobs()
-    clean_emp_histories()
-    clean_applications()
-    clean_applications()
+    cleaners = [
+        clean_organizations,
+        clean_candidates,
+        clean_jobs,
+        clean_emp_histories,
+        clean_applications,
+    ]
+    if not max_workers:
+        max_workers = min(len(cleaners), os.cpu_count() or 1)
+
+    if max_workers == 1:
+        for cleaner in cleaners:
+            cleaner()
+        return
+
+    # Spawn fresh interpreters rather than forking a process running Arrow threads
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [executor.submit(cleaner) for cleaner in cleaners]
+        for future in futures:
+            future.result()
@@ -0,0 +1,229 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+
+import helpers as hp
+
+
+class StageParquetTest(unittest.TestCase):
+    def test_type_after_first_block(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "sparse.csv")
+            n = 100_000
+            with open(filename, "w") as f:
+                f.write("Id,Fee,Note\n")
+                for i in range(n - 10):
+                    f.write(f"a{i},,\n")
+                for i in range(n - 10, n):
+                    f.write(f"a{i},12.5,late\n")
+
+            with mock.patch.object(hp, "CSV_BLOCK_SIZE", 1 << 16), mock.patch.object(
+                hp, "RAW_PARQUET_DIR", os.path.join(tmp, "raw_parquet")
+            ):
+                df = hp.read_raw_data(filename, {"Id": "id", "Fee": "fee"})
+
+            self.assertEqual(len(df), n)
+            self.assertEqual(df["fee"].iloc[-1], 12.5)
+            self.assertEqual(df["fee"].notna().sum(), 10)
+
+
+class ReadRawDataTest(unittest.TestCase):
+    def test_parse_date_only_column(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "dates.csv")
+            with open(filename, "w") as f:
+                f.write("Id,Received\na1,2019-05-13\na2,\n")
+
+            with mock.patch.object(
+                hp, "RAW_PARQUET_DIR", os.path.join(tmp, "raw_parquet")
+            ):
+                df = hp.read_raw_data(
+                    filename,
+                    {"Id": "id", "Received": "received_at"},
+                    parse_dates=["Received"],
+                )
+
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["received_at"]))
+            self.assertEqual(df["received_at"].iloc[0], pd.Timestamp("2019-05-13"))
+            self.assertTrue(pd.isna(df["received_at"].iloc[1]))
+
+
+class ParseDateSeriesTest(unittest.TestCase):
+    def test_fixed_dtype(self):
+        for values in [["2019", "2020"], ["2019-05-13", "13/05/2019"], [None]]:
+            result = hp.parse_date_series(pd.Series(values, dtype=object))
+            self.assertEqual(result.dtype, hp.DATE_DTYPE)
+
+    def test_formats(self):
+        s = pd.Series(
+            ["2019-05-13", "13/05/2019", "05-2019", "2019", "31-02-2020", None]
+        )
+        expected = ["2019-05-13", "2019-05-13", "2019-05-01", "2019-01-01", None, None]
+        result = hp.parse_date_series(s)
+        self.assertEqual(result.tolist(), [pd.Timestamp(x) for x in expected])
+
+    def test_trailing_time(self):
+        s = pd.Series(["2019-05-13 10:00", "2019-05-13T00:00:00"])
+        result = hp.parse_date_series(s)
+        self.assertEqual(
+            result.tolist(),
+            [pd.Timestamp("2019-05-13 10:00"), pd.Timestamp("2019-05-13")],
+        )
+
+
+class NormalizeDateTest(unittest.TestCase):
+    def test_matches_series(self):
+        values = ["2019-05-13", "13/05/2019", "2019", "31-02-2020", "29-02-2019", None]
+        expected = hp.normalize_date_series(pd.Series(values)).tolist()
+        self.assertEqual([hp.normalize_date(x) for x in values], expected)
+        self.assertEqual(expected[3:], ["0001-01-01"] * 3)
+
+
+class ReplaceSeriesTest(unittest.TestCase):
+    def test_chained_mapping(self):
+        s = pd.Series(["A", "B", "C", "D"])
+        result = hp.replace_series(s, {"B": ["A"], "C": ["B"]})
+        self.assertEqual(result.tolist(), ["C", "C", "C", "D"])
+
+    def test_first_pair_wins(self):
+        s = pd.Series(["A", "D"])
+        result = hp.replace_series(s, {"B": ["A"], "C": "A"})
+        self.assertEqual(result.tolist(), ["B", "D"])
+
+
+class ReplaceSeriesByPrefixTest(unittest.TestCase):
+    def replace(self, s, prefix_mapping):
+        pattern, lookup = hp.compile_prefix_mapping(prefix_mapping)
+        return hp.replace_series_by_prefix(pd.Series(s), pattern, lookup).tolist()
+
+    def test_chained_prefixes(self):
+        pattern, lookup = hp.compile_prefix_mapping(hp.SKILLS_PREFIX_MAPPING)
+        self.assertEqual(lookup["DATA MO"], "DATA MANAGEMENT")
+        s = pd.Series(["DATA MODELLING", "DATA MOBILE"])
+        result = hp.replace_series_by_prefix(s, pattern, lookup)
+        self.assertEqual(result.tolist(), ["DATA MANAGEMENT", "DATA MANAGEMENT"])
+
+    def test_first_prefix_wins(self):
+        s = ["ABC", "AC", "B"]
+        self.assertEqual(self.replace(s, {"AB": "X", "A": "Y"}), ["X", "Y", "B"])
+        self.assertEqual(self.replace(s, {"A": "Y", "AB": "X"}), ["Y", "Y", "B"])
+
+    def test_missing_values(self):
+        result = self.replace(["ABC", None], {"AB": "X"})
+        self.assertEqual(result[0], "X")
+        self.assertTrue(pd.isna(result[1]))
+
+    def test_split_multi_token_replacement(self):
+        s = pd.Series(["Data Modelling, Rest", "api rest, Java, rest"])
+        result = hp.normalize_skills_series_extra(s)
+        self.assertEqual(result.tolist(), ["DATA MANAGEMENT;API;REST", "API;REST;JAVA"])
+
+
+class SqueezeSeriesTest(unittest.TestCase):
+    def test_dedup_in_order_of_appearance(self):
+        s = pd.Series(["B", "A", "B", None, "C", "A"], index=[1, 1, 1, 2, 0, 0])
+        result = hp.squeeze_series(s)
+        self.assertEqual(result.to_dict(), {1: "B;A", 0: "C;A"})
+        self.assertEqual(result.dtype, hp.ARROW_STRING)
+
+    def test_separator(self):
+        s = pd.Series(["A", "B", "A"], index=[0, 0, 0])
+        self.assertEqual(hp.squeeze_series(s, sep=", ").tolist(), ["A, B"])
+
+    def test_empty_and_all_null(self):
+        for s in [pd.Series([], dtype=object), pd.Series([None, None], index=[0, 1])]:
+            result = hp.squeeze_series(s)
+            self.assertTrue(result.empty)
+            self.assertEqual(result.dtype, hp.ARROW_STRING)
+
+
+class ToIntTest(unittest.TestCase):
+    def test_fixed_dtype(self):
+        df = pd.DataFrame(
+            {
+                "small": pd.array([1.0, None], dtype=hp.ARROW_FLOAT),
+                "empty": pd.array([None, None], dtype=hp.ARROW_FLOAT),
+            }
+        )
+        hp.to_int(df, ["small", "empty"], pa.int16())
+        self.assertEqual(df["small"].dtype, pd.ArrowDtype(pa.int16()))
+        self.assertEqual(df["empty"].dtype, pd.ArrowDtype(pa.int16()))
+        self.assertEqual(df["small"].iloc[0], 1)
+        self.assertTrue(pd.isna(df["small"].iloc[1]))
+
+    def test_values_not_fitting(self):
+        for values in [[1.5], [200.0]]:
+            df = pd.DataFrame({"c": pd.array(values, dtype=hp.ARROW_FLOAT)})
+            with self.assertRaises(ValueError):
+                hp.to_int(df, ["c"], pa.int8())
+
+
+class CleanJobsTest(unittest.TestCase):
+    def test_text_columns(self):
+        header = [
+            "Id",
+            "AVTRRT__Job_Title__c",
+            "AVTRRT__Job_Description__c",
+            "AVTRRT__Job_Category__c",
+            "AVTRRT__Job_Term__c",
+            "Type_of_contract__c",
+            "AVTRRT__Number_of_Positions__c",
+            "Reason_for_requisition__c",
+            "AVTRRT__Experience__c",
+            "AVTRRT__AutoPopulated_Skills__c",
+            "Team_Leading__c",
+            "Project_Management__c",
+            "Travel__c",
+            "Languages__c",
+            "Language_02__c",
+            "Level_Language_01__c",
+            "Level_Language_02__c",
+            "CurrencyIsoCode",
+            "Fix_Salary__c",
+            "Variable_Bonus__c",
+            "Benefits__c",
+            "Location__c",
+            "OSN_Practice__c",
+            "Commission_Fee__c",
+            "CreatedDate",
+        ]
+        rows = [
+            "a0Fb0000003SB4AEAW,Analyst Programmer Big Data,Una societa,Consulting,"
+            "Permanent,Permanent,3,Increase in HC,04-06 years,Big Data;Hadoop,3-5,"
+            "Yes,100%,English,Italian,Basic User,Basic User,EUR,55000,,"
+            "Meal coupons;Mobile,Milan,Data Engineering,20,2014-04-19T08:22:48.000Z",
+            "a0Fb0000003SB4BEAW,Data Scientist,,,,,,,,,,,,,,,,EUR,,,,,,,"
+            "2014-04-20T08:22:48.000Z",
+        ]
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "data", "original"))
+            os.makedirs(os.path.join(tmp, "data", "cleaned"))
+            filename = os.path.join(
+                tmp, "data", "original", "AVTRRT__Job_Anonymized.csv"
+            )
+            with open(filename, "w") as f:
+                f.write(",".join(header) + "\n" + "\n".join(rows) + "\n")
+
+            os.chdir(tmp)
+            try:
+                hp.clean_jobs()
+                df = hp.read_feather("data/cleaned/jobs.feather")
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(df["job_team_lead_size"].tolist()[0], "3-5")
+        self.assertEqual(df["job_pct_travel"].tolist()[0], "100%")
+        self.assertEqual(df["job_n_positions"].dtype, pd.ArrowDtype(pa.int16()))
+        self.assertEqual(df["job_n_positions"].iloc[0], 3)
+        self.assertTrue(pd.isna(df["job_n_positions"].iloc[1]))
+        self.assertEqual(df["job_salary"].iloc[0], 55000)
+
+
+if __name__ == "__main__":
+    unittest.main()